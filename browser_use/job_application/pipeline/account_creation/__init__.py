@@ -2,15 +2,13 @@
 
 from browser_use.job_application.pipeline.account_creation.run import (
 	check_account_creation_complete,
-	get_account_creation_actions,
-	plan_account_creation,
+	plan_and_get_account_creation_actions,
 	run,
 )
 
 __all__ = [
 	'run',
-	'plan_account_creation',
-	'get_account_creation_actions',
+	'plan_and_get_account_creation_actions',
 	'check_account_creation_complete',
 ]
 
@@ -1,9 +1,10 @@
 """Account creation step implementation."""
 
 import asyncio
+import functools
 import importlib.resources
 import logging
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.views import BrowserStateSummary
@@ -11,19 +12,20 @@ from browser_use.job_application.pipeline.account_creation.schema import *  # no
 from browser_use.job_application.pipeline.navigation.run import (
 	check_navigation_complete,
 	execute_navigation_actions,
-	get_navigation_actions,
-	plan_navigation,
 	prepare_navigation_context,
 )
 from browser_use.job_application.pipeline.page_classification.run import run as classify_page
 from browser_use.job_application.pipeline.shared.enums import PageType
-from browser_use.job_application.pipeline.shared.utils import debug_input, format_browser_state_message
+from browser_use.job_application.pipeline.shared.utils import (
+	build_step_messages,
+	debug_input,
+	get_page_actions,
+	retry_delay,
+)
 from browser_use.job_application.pipeline.state import PipelineState
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import UserMessage
 from browser_use.tools.registry.views import ActionModel
 from browser_use.tools.service import Tools
-from browser_use.agent.views import AgentOutput, PlanOutput
 
 if TYPE_CHECKING:
 	pass
@@ -31,8 +33,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
 def _load_prompt() -> str:
-	"""Load the account creation prompt template."""
+	"""Load the account creation prompt (read once and cached; it holds no credentials)."""
 	try:
 		with importlib.resources.files('browser_use.job_application.pipeline.account_creation').joinpath(
 			'prompt.md'
@@ -42,72 +45,53 @@ def _load_prompt() -> str:
 		raise RuntimeError(f'Failed to load account creation prompt: {e}')
 
 
-def _build_prompt(email: Optional[str] = None, password: Optional[str] = None) -> str:
-	"""Build the account creation prompt.
+def _build_credentials_prompt(email: Optional[str] = None, password: Optional[str] = None) -> str:
+	"""Build the credentials block of the account creation user message.
+	
+	Built on every call and never cached, so credentials are neither kept in memory after the step nor part of
+	the cacheable system prompt.
 	
 	Args:
 		email: User email for account creation/sign-in
 		password: User password for account creation/sign-in
 		
 	Returns:
-		Formatted prompt string
+		Formatted credentials block
 	"""
-	template = _load_prompt()
-	
 	# Default values if not provided
 	email = email or "[EMAIL_NOT_PROVIDED]"
 	password = password or "[PASSWORD_NOT_PROVIDED]"
 	
-	return template.format(email=email, password=password)
+	return f'<user_credentials>\nEmail: {email}\nPassword: {password}\n</user_credentials>'
 
 
 async def check_account_creation_complete(
 	browser_session: BrowserSession,
 	llm: BaseChatModel,
+	browser_state: Optional[BrowserStateSummary] = None,
+	pipeline_state: Optional[PipelineState] = None,
 ) -> PageType:
 	"""Check if account creation is complete by re-classifying the page.
 	
 	Args:
 		browser_session: Browser session
 		llm: LLM for page classification
+		browser_state: Optional browser state already fetched for this step
+		pipeline_state: Optional pipeline state whose LLM cache the classification may reuse
 		
 	Returns:
 		The classified page type
 	"""
 	logger.debug('🔍 Checking if account creation is complete...')
-	page_type = await classify_page(browser_session, llm)
+	page_type = await classify_page(browser_session, llm, browser_state=browser_state, pipeline_state=pipeline_state)
 	# Account creation is complete if we're no longer on account creation page
 	return page_type
 
 
-async def plan_account_creation(
-	browser_session: BrowserSession,
-	llm: BaseChatModel,
-	browser_state: BrowserStateSummary,
-	email: Optional[str] = None,
-	password: Optional[str] = None,
-) -> Optional[str]:
-	"""Plan account creation/sign-in steps using LLM.
-	
-	Args:
-		browser_session: Browser session
-		llm: LLM for planning
-		browser_state: Current browser state
-		email: User email
-		password: User password
-		
-	Returns:
-		Account creation plan or None if planning failed
-	"""
-	logger.debug('📋 Planning account creation steps...')
-
-	# Build planning prompt (instructions only) with user credentials
-	prompt_text = _build_prompt(email, password)
-	
-	# Add planning instructions
-	planning_instructions = f"""{prompt_text}
+_PLAN_AND_ACT_INSTRUCTIONS = """You are in the PLAN AND ACT phase for account creation/sign-in. In one response, create a focused plan for completing the account creation or sign-in process AND select the actions that carry out its first step(s).
 
-You are in the PLANNING phase for account creation/sign-in. Your task is to create a focused plan for completing the account creation or sign-in process.
+**Available Actions:**
+{actions_description}
 
 **Your Plan Should:**
 1. Identify what type of page you're on (sign-in, account creation, email verification)
@@ -120,103 +104,114 @@ You are in the PLANNING phase for account creation/sign-in. Your task is to crea
 - If on account creation: Fill registration form and submit
 - If on email verification: Handle verification flow
 
-Return your plan with rationale explaining your reasoning."""
+**Action Selection Guidelines:**
+- If your plan says "fill email/password", use input actions with the email and password from <user_credentials>
+- If your plan says "click Sign In", use click action with the element index
+- If your plan says "click Create Account", use click action
+- If your plan says "enter verification code", use input action
+- Select 1-3 actions per step to make progress
 
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
-	
-	# Combine into ONE message
-	combined_content = f"{planning_instructions}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
-	messages = [UserMessage(content=combined_content)]
+**Important:** When filling email or password fields, use the exact values provided above.
 
-	try:
-		response = await llm.ainvoke(messages, output_format=PlanOutput)
-		plan_output = response.completion
-		logger.info(f'📋 Account Creation Plan: {plan_output.plan}')
-		debug_input('[DEBUG] Press Enter to continue after account creation planning...')
-		return plan_output.plan
-	except Exception as e:
-		logger.warning(f'Planning failed: {e}. Continuing without plan.')
-		return None
+Return your rationale, your plan, and the selected actions."""
+
+
+_ACTION_SELECTION_INSTRUCTIONS = """You are in the ACTION SELECTION phase for account creation/sign-in.
+
+**Available Actions:**
+{actions_description}
+
+**Account Creation Plan:**
+No plan available - determine actions based on current state
+
+**Your Task:**
+Select the specific actions needed to complete the account creation or sign-in process.
 
+**Action Selection Guidelines:**
+- To fill email/password, use input actions with the email and password from <user_credentials>
+- To sign in or create the account, use click action with the button's element index
+- To enter a verification code, use input action
+- Select 1-3 actions per step to make progress
+
+**Important:** When filling email or password fields, use the exact values provided above.
+
+Return your selected actions."""
+
+
+@functools.cache
+def _build_plan_and_act_prompt(actions_description: str) -> str:
+	"""Build the static part of the plan-and-act prompt (cached per available action set, without credentials)."""
+	instructions = _PLAN_AND_ACT_INSTRUCTIONS.format(actions_description=actions_description)
+	return f'{_load_prompt()}\n\n{instructions}'
+
+
+@functools.cache
+def _build_action_selection_prompt(actions_description: str) -> str:
+	"""Build the static part of the plan-less action selection prompt (cached per action set, without credentials)."""
+	instructions = _ACTION_SELECTION_INSTRUCTIONS.format(actions_description=actions_description)
+	return f'{_load_prompt()}\n\n{instructions}'
 
-async def get_account_creation_actions(
+
+async def plan_and_get_account_creation_actions(
 	browser_session: BrowserSession,
 	llm: BaseChatModel,
 	tools: Tools,
 	browser_state: BrowserStateSummary,
-	plan: Optional[str],
+	previous_plan: Optional[str] = None,
 	email: Optional[str] = None,
 	password: Optional[str] = None,
-) -> List[ActionModel]:
-	"""Get account creation actions from LLM based on plan.
+) -> Tuple[Optional[str], List[ActionModel]]:
+	"""Plan account creation/sign-in steps and select the actions for this step in a single LLM call.
+	
+	If the combined call fails, actions are selected without a plan instead, so a planning failure does not
+	cost the whole step.
 	
 	Args:
 		browser_session: Browser session
-		llm: LLM for action selection
+		llm: LLM for planning and action selection
 		tools: Tools registry
 		browser_state: Current browser state
-		plan: Optional plan
+		previous_plan: Plan produced in the previous account creation step, if any
 		email: User email
 		password: User password
 		
 	Returns:
-		List of actions to execute
+		Tuple of (account creation plan or the previous plan if planning failed, list of actions to execute)
 	"""
-	logger.debug('🤖 Getting account creation actions from LLM...')
-
-	# Get available actions for this page
-	page_filtered_actions = tools.registry.get_prompt_description(browser_state.url)
-	actions_description = page_filtered_actions if page_filtered_actions else 'Available actions: click, input, navigate, search, etc.'
+	logger.debug('📋 Planning account creation steps and selecting actions...')
 
-	# Build account creation prompt with user credentials
-	account_creation_prompt = _build_prompt(email, password)
+	# Get available actions for this page (cached per page origin)
+	page_actions = get_page_actions(tools, browser_state.url)
+	actions_description = page_actions.description if page_actions.description else 'Available actions: click, input, navigate, search, etc.'
 
-	# Build action selection prompt
-	plan_text = plan if plan else "No plan available - determine actions based on current state"
-	action_prompt_content = f"""{account_creation_prompt}
+	previous_plan_text = previous_plan if previous_plan else 'None - this is the first account creation step'
+	credentials_prompt = _build_credentials_prompt(email, password)
 
-You are in the ACTION SELECTION phase for account creation/sign-in.
+	# Static instructions (cached per action set) form the cacheable prefix; the credentials, previous plan and
+	# state are sent fresh in the user message
+	messages = build_step_messages(
+		_build_plan_and_act_prompt(actions_description),
+		[credentials_prompt, f'**Plan From The Previous Step:**\n{previous_plan_text}'],
+		browser_state,
+	)
 
-**Available Actions:**
-{actions_description}
-
-**Account Creation Plan:**
-{plan_text}
-
-**Your Task:**
-Select the specific actions needed to complete account creation or sign-in. Use the plan to guide your action selection.
-
-**Action Selection Guidelines:**
-- If plan says "fill email/password", use input actions with email="{email or '[EMAIL_NOT_PROVIDED]'}" and password="{password or '[PASSWORD_NOT_PROVIDED]'}"
-- If plan says "click Sign In", use click action with the element index
-- If plan says "click Create Account", use click action
-- If plan says "enter verification code", use input action
-- Select 1-3 actions per step to make progress
-
-**Important:** When filling email or password fields, use the exact values provided above.
-
-Return your selected actions."""
-
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
-	
-	# Combine into ONE message
-	combined_content = f"{action_prompt_content}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
-	messages = [UserMessage(content=combined_content)]
-
-	# Create AgentOutput type with available actions
-	# Get the action model for the current page (filters actions by URL)
-	ActionModel = tools.registry.create_action_model(page_url=browser_state.url)
-	AgentOutputType = AgentOutput.type_with_custom_actions_no_thinking(ActionModel)
+	try:
+		response = await llm.ainvoke(messages, output_format=page_actions.plan_and_act_type)
+		output = response.completion
+		logger.info('📋 Account Creation Plan: %s', output.plan)
+		logger.info('⚡ Selected %d account creation action(s)', len(output.action))
+		await debug_input(f'[DEBUG] Press Enter to continue after account creation planning ({len(output.action)} actions)...')
+		return output.plan, output.action
+	except Exception as e:
+		logger.warning(f'Planning failed: {e}. Continuing without plan.')
 
+	messages = build_step_messages(_build_action_selection_prompt(actions_description), [credentials_prompt], browser_state)
 	try:
-		response = await llm.ainvoke(messages, output_format=AgentOutputType)
-		agent_output = response.completion
-		actions = agent_output.action
-		logger.info(f'⚡ Selected {len(actions)} account creation action(s)')
-		debug_input(f'[DEBUG] Press Enter to continue after account creation action selection ({len(actions)} actions)...')
-		return actions
+		response = await llm.ainvoke(messages, output_format=page_actions.actions_only_type)
+		actions = response.completion.action
+		logger.info('⚡ Selected %d account creation action(s)', len(actions))
+		await debug_input(f'[DEBUG] Press Enter to continue after account creation action selection ({len(actions)} actions)...')
+		return previous_plan, actions
 	except Exception as e:
 		logger.error(f'Failed to get account creation actions: {e}')
 		raise
@@ -229,7 +224,7 @@ async def run(
 	pipeline_state: PipelineState,
 	email: Optional[str] = None,
 	password: Optional[str] = None,
-) -> None:
+) -> PageType:
 	"""Handle account creation or sign-in flow using full agent loop.
 	
 	Args:
@@ -240,52 +235,54 @@ async def run(
 		email: User email
 		password: User password
 		
+	Returns:
+		The page type observed by the final completion check (the caller need not classify the page again)
+		
 	Raises:
 		RuntimeError: If account creation fails after max attempts
 	"""
 	max_steps = 20
 	consecutive_failures = 0
 	max_failures = 3
+	previous_plan: Optional[str] = None
 
 	logger.info('🔐 Starting account creation/sign-in flow...')
 
 	for step in range(max_steps):
 		pipeline_state.navigation_attempts += 1
-		logger.info(f'📍 Account creation step {step + 1}/{max_steps}')
+		logger.info('📍 Account creation step %d/%d', step + 1, max_steps)
 
 		try:
 			# Phase 1: Read DOM - Get browser state
 			browser_state = await prepare_navigation_context(browser_session, include_all_form_fields=True)
 
 			# Phase 2: Check if we've completed account creation (reached application or job description)
-			page_type = await check_account_creation_complete(browser_session, llm)
-			if page_type in [PageType.APPLICATION_PAGE, PageType.JOB_DESCRIPTION]:
+			page_type = await check_account_creation_complete(browser_session, llm, browser_state, pipeline_state)
+			if page_type is PageType.APPLICATION_PAGE or page_type is PageType.JOB_DESCRIPTION:
 				logger.info('✅ Successfully completed account creation/sign-in!')
-				return
+				return page_type
 
-			# Phase 3: Plan account creation steps
-			plan = await plan_account_creation(browser_session, llm, browser_state, email, password)
+			# Phase 3: Plan account creation steps and select this step's actions in one LLM call
+			previous_plan, actions = await plan_and_get_account_creation_actions(
+				browser_session, llm, tools, browser_state, previous_plan, email, password
+			)
 
-			# Phase 4: Get account creation actions
-			actions = await get_account_creation_actions(browser_session, llm, tools, browser_state, plan, email, password)
-
-			# Phase 5: Execute actions
+			# Phase 4: Execute actions
 			results = await execute_navigation_actions(browser_session, tools, actions)
 
 			# Check for errors
 			if results and any(r.error for r in results):
 				consecutive_failures += 1
-				logger.warning(f'⚠️ Account creation step failed. Consecutive failures: {consecutive_failures}')
+				logger.warning('⚠️ Account creation step failed. Consecutive failures: %d', consecutive_failures)
 				if consecutive_failures >= max_failures:
 					logger.error(f'❌ Account creation failed after {max_failures} consecutive failures')
 					raise RuntimeError('Account creation failed: too many consecutive failures')
+				await asyncio.sleep(retry_delay(consecutive_failures, next(r.error for r in results if r.error)))
 			else:
 				consecutive_failures = 0
 
-			# Wait for page to stabilize after actions
-			if browser_session._dom_watchdog:
-				await browser_session._dom_watchdog.wait_for_page_stability()
-			else:
+			# The next step's prepare_navigation_context waits for the page to stabilize after these actions
+			if not browser_session._dom_watchdog:
 				await asyncio.sleep(1.0)
 
 		except Exception as e:
@@ -293,6 +290,7 @@ async def run(
 			consecutive_failures += 1
 			if consecutive_failures >= max_failures:
 				raise RuntimeError(f'Account creation failed after {max_failures} consecutive failures: {e}')
+			await asyncio.sleep(retry_delay(consecutive_failures, str(e)))
 
 	# If we get here, we didn't complete account creation
 	raise RuntimeError(f'Failed to complete account creation after {max_steps} steps')
@@ -1,7 +1,7 @@
 """Answer generation step for the job application pipeline."""
 
-from browser_use.job_application.pipeline.answer_generation.run import run
+from browser_use.job_application.pipeline.answer_generation.run import run, run_batch
 from browser_use.job_application.pipeline.answer_generation.schema import AnswerGenerationOutput
 
-__all__ = ['run', 'AnswerGenerationOutput']
+__all__ = ['run', 'run_batch', 'AnswerGenerationOutput']
 
@@ -1,12 +1,14 @@
 """Answer generation step implementation."""
 
+import asyncio
+import functools
 import importlib.resources
 import json
 import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import httpx
 
@@ -23,9 +25,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Most LLM answer calls a batch has in flight at once (a section can extract dozens of questions)
+MAX_CONCURRENT_ANSWERS = 4
 
+
+@functools.cache
 def _load_prompt() -> str:
-	"""Load the answer generation prompt template."""
+	"""Load the answer generation prompt template (read once and cached)."""
 	try:
 		with importlib.resources.files('browser_use.job_application.pipeline.answer_generation').joinpath(
 			'prompt.md'
@@ -235,7 +241,7 @@ async def run(
 				logger.error(f'Failed to download file from answer_value "{answer_value}": {e}')
 				# Keep answer_value as-is if download fails
 		
-		debug_input(f'[DEBUG] Press Enter to continue after answer generation for: "{question.question_text[:50]}..."...')
+		await debug_input(f'[DEBUG] Press Enter to continue after answer generation for: "{question.question_text[:50]}..."...')
 		
 		# Convert to QuestionAnswer
 		return QuestionAnswer(
@@ -257,3 +263,59 @@ async def run(
 			error_message=f'Answer generation failed: {str(e)}',
 		)
 
+
+async def run_batch(
+	questions: List[ApplicationQuestion],
+	llm: BaseChatModel,
+	user_profile: dict,
+	answer_generator_client: Optional[AnswerGeneratorClient] = None,
+) -> List[QuestionAnswer]:
+	"""Generate answers for several questions at once.
+	
+	Uses one websocket round-trip for all questions when the answer generator is available, otherwise
+	generates the LLM answers concurrently, at most MAX_CONCURRENT_ANSWERS at a time. A question whose
+	generation fails gets a failed placeholder answer without affecting the others.
+	
+	Args:
+		questions: The questions to generate answers for
+		llm: LLM for answer generation
+		user_profile: User profile data dictionary
+		answer_generator_client: Optional websocket client for answer generation
+		
+	Returns:
+		Generated answers, in the same order as the questions
+	"""
+	if not questions:
+		return []
+
+	if answer_generator_client:
+		try:
+			return await answer_generator_client.generate_answers(questions)
+		except NotImplementedError:
+			logger.warning('Websocket answer generation not available, using LLM')
+		except Exception as e:
+			logger.error(f'Failed to generate answers via websocket: {e}')
+
+	# Answers only depend on the question and the profile, so they can be generated concurrently; the
+	# semaphore keeps a large section from firing one LLM call per question all at once
+	semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANSWERS)
+
+	async def generate(question: ApplicationQuestion) -> QuestionAnswer:
+		async with semaphore:
+			return await run(question, llm, user_profile)
+
+	results = await asyncio.gather(*(generate(question) for question in questions), return_exceptions=True)
+	answers = []
+	for question, result in zip(questions, results):
+		if isinstance(result, Exception):
+			logger.error(f'Failed to generate answer for "{question.question_text}": {result}')
+			result = QuestionAnswer(
+				question_text=question.question_text,
+				answer_value='PLACEHOLDER_ANSWER',
+				answer_type=question.question_type,
+				element_index=question.element_index,
+				filled_successfully=False,
+				error_message=f'Answer generation failed: {str(result)}',
+			)
+		answers.append(result)
+	return answers
@@ -3,9 +3,8 @@
 from browser_use.job_application.pipeline.navigation.run import (
 	check_navigation_complete,
 	execute_navigation_actions,
-	get_navigation_actions,
 	navigate_to_next_page,
-	plan_navigation,
+	plan_and_get_navigation_actions,
 	prepare_navigation_context,
 	run,
 )
@@ -14,8 +13,7 @@ from browser_use.job_application.pipeline.navigation.schema import NavigationRes
 __all__ = [
 	'run',
 	'navigate_to_next_page',
-	'plan_navigation',
-	'get_navigation_actions',
+	'plan_and_get_navigation_actions',
 	'execute_navigation_actions',
 	'check_navigation_complete',
 	'prepare_navigation_context',
@@ -1,22 +1,30 @@
 """Navigation step implementation."""
 
 import asyncio
+import functools
 import importlib.resources
 import logging
-from typing import TYPE_CHECKING, Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.job_application.pipeline.navigation.schema import NavigationResult
 from browser_use.job_application.pipeline.page_classification.run import run as classify_page
 from browser_use.job_application.pipeline.shared.enums import PageType
-from browser_use.job_application.pipeline.shared.utils import debug_input, format_browser_state_message
+from browser_use.job_application.pipeline.shared.utils import (
+	action_name,
+	build_step_messages,
+	debug_input,
+	get_page_actions,
+	needs_dom_settle,
+	retry_delay,
+	wait_for_dom_settle,
+)
 from browser_use.job_application.pipeline.state import PipelineState
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import UserMessage
 from browser_use.tools.registry.views import ActionModel
 from browser_use.tools.service import Tools
-from browser_use.agent.views import AgentOutput, ActionResult, PlanOutput
+from browser_use.agent.views import ActionResult
 
 if TYPE_CHECKING:
 	pass
@@ -24,8 +32,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
 def _load_prompt() -> str:
-	"""Load the navigation prompt template."""
+	"""Load the navigation prompt template (read once and cached)."""
 	try:
 		with importlib.resources.files('browser_use.job_application.pipeline.navigation').joinpath(
 			'prompt.md'
@@ -38,56 +47,40 @@ def _load_prompt() -> str:
 async def prepare_navigation_context(
 	browser_session: BrowserSession,
 	include_all_form_fields: bool = False,
+	include_screenshot: bool = False,
 ) -> BrowserStateSummary:
-	"""Prepare context for navigation: get browser state and wait for stability.
+	"""Prepare context for navigation: wait for stability, then get browser state.
+	
+	The wait comes first so the state is read from the settled page. This is also the only stability wait of
+	a navigation step, covering the page changes from the previous step's actions.
 	
 	Args:
 		browser_session: Browser session
 		include_all_form_fields: Whether to include all form fields
+		include_screenshot: Whether to capture a screenshot. Navigation prompts are text-only, so this is off
+			unless a caller actually attaches the image to its messages.
 		
 	Returns:
 		Browser state summary
 	"""
-	logger.debug('🌐 Getting browser state for navigation...')
-	
-	# Get browser state
-	browser_state = await browser_session.get_browser_state_summary(
-		include_screenshot=True,
-		include_all_form_fields=include_all_form_fields,
-	)
-
 	# Wait for page stability
 	if browser_session._dom_watchdog:
 		logger.debug('🔍 Waiting for page stability...')
 		await browser_session._dom_watchdog.wait_for_page_stability()
 
-	return browser_state
-
-
-async def plan_navigation(
-	browser_session: BrowserSession,
-	llm: BaseChatModel,
-	browser_state: BrowserStateSummary,
-) -> Optional[str]:
-	"""Plan navigation steps using LLM.
+	logger.debug('🌐 Getting browser state for navigation...')
 	
-	Args:
-		browser_session: Browser session
-		llm: LLM for planning
-		browser_state: Current browser state
-		
-	Returns:
-		Navigation plan or None if planning failed
-	"""
-	logger.debug('📋 Planning navigation steps...')
+	# Get browser state
+	return await browser_session.get_browser_state_summary(
+		include_screenshot=include_screenshot,
+		include_all_form_fields=include_all_form_fields,
+	)
 
-	# Load prompt template
-	prompt_text = _load_prompt()
-	
-	# Add planning instructions
-	planning_instructions = f"""{prompt_text}
 
-You are in the PLANNING phase for navigation. Your task is to create a focused plan for navigating from the current page to the job application page.
+_PLAN_AND_ACT_INSTRUCTIONS = """You are in the PLAN AND ACT phase for navigation. In one response, create a focused plan for navigating from the current page to the job application page AND select the actions that carry out its first step(s).
+
+**Available Actions:**
+{actions_description}
 
 **Your Plan Should:**
 1. Identify what page you're currently on (job description, login, account creation, etc.)
@@ -101,91 +94,101 @@ You are in the PLANNING phase for navigation. Your task is to create a focused p
 - If on account creation: Fill registration form and submit
 - If on email verification: Handle verification flow
 
-Return your plan with rationale explaining your reasoning."""
-	
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
-	
-	# Combine into ONE message
-	combined_content = f"{planning_instructions}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
-	messages = [UserMessage(content=combined_content)]
+**Action Selection Guidelines:**
+- If your plan says "click Apply button", use click action with the element index
+- If your plan says "fill login form", use input actions for each field
+- If your plan says "navigate to URL", use navigate action
+- Select 1-3 actions per step to make progress
 
-	try:
-		response = await llm.ainvoke(messages, output_format=PlanOutput)
-		plan_output = response.completion
-		logger.info(f'📋 Navigation Plan: {plan_output.plan}')
-		debug_input('[DEBUG] Press Enter to continue after navigation planning...')
-		return plan_output.plan
-	except Exception as e:
-		logger.warning(f'Planning failed: {e}. Continuing without plan.')
-		return None
+Return your rationale, your plan, and the selected actions."""
+
+
+_ACTION_SELECTION_INSTRUCTIONS = """You are in the ACTION SELECTION phase for navigation.
+
+**Available Actions:**
+{actions_description}
+
+**Navigation Plan:**
+No plan available - determine actions based on current state
 
+**Your Task:**
+Select the specific actions needed to progress toward the application page.
+
+**Action Selection Guidelines:**
+- To apply, use click action with the element index of the "Apply" or "Apply Now" button
+- To fill a login form, use input actions for each field
+- To go to a URL, use navigate action
+- Select 1-3 actions per step to make progress
+
+Return your selected actions."""
+
+
+@functools.cache
+def _build_plan_and_act_prompt(actions_description: str) -> str:
+	"""Build the static part of the plan-and-act prompt (cached per available action set)."""
+	return f'{_load_prompt()}\n\n{_PLAN_AND_ACT_INSTRUCTIONS.format(actions_description=actions_description)}'
+
+
+@functools.cache
+def _build_action_selection_prompt(actions_description: str) -> str:
+	"""Build the static part of the plan-less action selection prompt (cached per available action set)."""
+	return f'{_load_prompt()}\n\n{_ACTION_SELECTION_INSTRUCTIONS.format(actions_description=actions_description)}'
 
-async def get_navigation_actions(
+
+async def plan_and_get_navigation_actions(
 	browser_session: BrowserSession,
 	llm: BaseChatModel,
 	tools: Tools,
 	browser_state: BrowserStateSummary,
-	plan: Optional[str],
-) -> List[ActionModel]:
-	"""Get navigation actions from LLM based on plan.
+	previous_plan: Optional[str] = None,
+) -> Tuple[Optional[str], List[ActionModel]]:
+	"""Plan navigation steps and select the actions for this step in a single LLM call.
+	
+	If the combined call fails, actions are selected without a plan instead, so a planning failure does not
+	cost the whole step.
 	
 	Args:
 		browser_session: Browser session
-		llm: LLM for action selection
+		llm: LLM for planning and action selection
 		tools: Tools registry
 		browser_state: Current browser state
-		plan: Navigation plan
+		previous_plan: Plan produced in the previous navigation step, if any
 		
 	Returns:
-		List of actions to execute
+		Tuple of (navigation plan or the previous plan if planning failed, list of actions to execute)
 	"""
-	logger.debug('🤖 Getting navigation actions from LLM...')
-
-	# Get available actions for this page
-	page_filtered_actions = tools.registry.get_prompt_description(browser_state.url)
-	actions_description = page_filtered_actions if page_filtered_actions else 'Available actions: click, input, navigate, search, etc.'
-
-	# Build action selection prompt
-	plan_text = plan if plan else "No plan available - determine actions based on current state"
-	action_prompt_content = f"""You are in the ACTION SELECTION phase for navigation.
-
-**Available Actions:**
-{actions_description}
-
-**Navigation Plan:**
-{plan_text}
-
-**Your Task:**
-Select the specific actions needed to progress toward the application page. Use the plan to guide your action selection.
+	logger.debug('📋 Planning navigation steps and selecting actions...')
 
-**Action Selection Guidelines:**
-- If plan says "click Apply button", use click action with the element index
-- If plan says "fill login form", use input actions for each field
-- If plan says "navigate to URL", use navigate action
-- Select 1-3 actions per step to make progress
+	# Get available actions for this page (cached per page origin)
+	page_actions = get_page_actions(tools, browser_state.url)
+	actions_description = page_actions.description if page_actions.description else 'Available actions: click, input, navigate, search, etc.'
 
-Return your selected actions."""
+	previous_plan_text = previous_plan if previous_plan else 'None - this is the first navigation step'
 
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
-	
-	# Combine into ONE message
-	combined_content = f"{action_prompt_content}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
-	messages = [UserMessage(content=combined_content)]
+	# Static instructions (cached per action set) form the cacheable prefix; only the previous plan and state are fresh
+	messages = build_step_messages(
+		_build_plan_and_act_prompt(actions_description),
+		f'**Plan From The Previous Step:**\n{previous_plan_text}',
+		browser_state,
+	)
 
-	# Create AgentOutput type with available actions
-	# Get the action model for the current page (filters actions by URL)
-	ActionModel = tools.registry.create_action_model(page_url=browser_state.url)
-	AgentOutputType = AgentOutput.type_with_custom_actions_no_thinking(ActionModel)
+	try:
+		response = await llm.ainvoke(messages, output_format=page_actions.plan_and_act_type)
+		output = response.completion
+		logger.info('📋 Navigation Plan: %s', output.plan)
+		logger.info('⚡ Selected %d navigation action(s)', len(output.action))
+		await debug_input(f'[DEBUG] Press Enter to continue after navigation planning ({len(output.action)} actions)...')
+		return output.plan, output.action
+	except Exception as e:
+		logger.warning(f'Planning failed: {e}. Continuing without plan.')
 
+	messages = build_step_messages(_build_action_selection_prompt(actions_description), [], browser_state)
 	try:
-		response = await llm.ainvoke(messages, output_format=AgentOutputType)
-		agent_output = response.completion
-		actions = agent_output.action
-		logger.info(f'⚡ Selected {len(actions)} navigation action(s)')
-		debug_input(f'[DEBUG] Press Enter to continue after navigation action selection ({len(actions)} actions)...')
-		return actions
+		response = await llm.ainvoke(messages, output_format=page_actions.actions_only_type)
+		actions = response.completion.action
+		logger.info('⚡ Selected %d navigation action(s)', len(actions))
+		await debug_input(f'[DEBUG] Press Enter to continue after navigation action selection ({len(actions)} actions)...')
+		return previous_plan, actions
 	except Exception as e:
 		logger.error(f'Failed to get navigation actions: {e}')
 		raise
@@ -206,13 +209,17 @@ async def execute_navigation_actions(
 	Returns:
 		List of action results
 	"""
-	logger.debug(f'⚡ Executing {len(actions)} navigation action(s)...')
+	logger.debug('⚡ Executing %d navigation action(s)...', len(actions))
 
-	results = []
+	# Actions run one at a time (they share focus and the page), so failures are collected and logged once
+	results: List[ActionResult] = []
+	failures: List[str] = []
+	action_names = [action_name(action) for action in actions]
 	for i, action in enumerate(actions):
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug('Executing action %d/%d: %s', i + 1, len(actions), action.model_dump(exclude_unset=True))
+
 		try:
-			logger.debug(f'Executing action {i + 1}/{len(actions)}: {action.model_dump(exclude_unset=True)}')
-			
 			result = await tools.act(
 				action=action,
 				browser_session=browser_session,
@@ -221,22 +228,23 @@ async def execute_navigation_actions(
 				available_file_paths=None,
 				file_system=None,
 			)
+		except Exception as e:
+			result = ActionResult(error=str(e))
 
-			results.append(result)
+		results.append(result)
 
-			if result.error:
-				logger.warning(f'⚠️ Action {i + 1} failed: {result.error}')
-			elif result.is_done:
-				logger.info(f'✅ Action {i + 1} completed task')
-				break
+		if result.error:
+			failures.append(f'{i + 1} ({action_names[i]}): {result.error}')
+		elif result.is_done:
+			logger.info('✅ Action %d completed task', i + 1)
+			break
 
-			# Wait between actions
-			if i < len(actions) - 1:
-				await asyncio.sleep(0.5)
+		# Let the DOM settle between actions (consecutive text inputs go straight through)
+		if i < len(actions) - 1 and needs_dom_settle(action_names[i], action_names[i + 1]):
+			await wait_for_dom_settle(browser_session, max_wait=0.5, quiet_period=0.1)
 
-		except Exception as e:
-			logger.error(f'❌ Action {i + 1} raised exception: {e}')
-			results.append(ActionResult(error=str(e)))
+	if failures:
+		logger.warning('⚠️ %d of %d navigation action(s) failed: %s', len(failures), len(results), '; '.join(failures))
 
 	return results
 
@@ -244,18 +252,22 @@ async def execute_navigation_actions(
 async def check_navigation_complete(
 	browser_session: BrowserSession,
 	llm: BaseChatModel,
+	browser_state: Optional[BrowserStateSummary] = None,
+	pipeline_state: Optional[PipelineState] = None,
 ) -> PageType:
 	"""Check if navigation is complete by re-classifying the page.
 	
 	Args:
 		browser_session: Browser session
 		llm: LLM for page classification
+		browser_state: Optional browser state already fetched for this step
+		pipeline_state: Optional pipeline state whose LLM cache the classification may reuse
 		
 	Returns:
 		The classified page type
 	"""
 	logger.debug('🔍 Checking if navigation to application page is complete...')
-	return await classify_page(browser_session, llm)
+	return await classify_page(browser_session, llm, browser_state=browser_state, pipeline_state=pipeline_state)
 
 
 async def run(
@@ -263,7 +275,8 @@ async def run(
 	llm: BaseChatModel,
 	tools: Tools,
 	pipeline_state: PipelineState,
-) -> None:
+	browser_state: Optional[BrowserStateSummary] = None,
+) -> PageType:
 	"""Navigate from job description to application page using full agent loop.
 	
 	Args:
@@ -271,6 +284,11 @@ async def run(
 		llm: LLM for navigation
 		tools: Tools registry
 		pipeline_state: Pipeline state for tracking attempts
+		browser_state: Optional state of the current page, already classified by the caller as not the
+			application page. The first step plans from it instead of fetching and classifying the page again.
+		
+	Returns:
+		The page type observed by the final completion check (the caller need not classify the page again)
 		
 	Raises:
 		RuntimeError: If navigation fails after max attempts
@@ -278,53 +296,56 @@ async def run(
 	max_navigation_steps = 20
 	consecutive_failures = 0
 	max_failures = 3
+	previous_plan: Optional[str] = None
 
 	logger.info('🚀 Starting navigation to application page...')
 
 	for step in range(max_navigation_steps):
 		pipeline_state.navigation_attempts += 1
-		logger.info(f'📍 Navigation step {step + 1}/{max_navigation_steps}')
+		logger.info('📍 Navigation step %d/%d', step + 1, max_navigation_steps)
 
 		try:
-			# Phase 1: Read DOM - Get browser state
-			browser_state = await prepare_navigation_context(browser_session)
-
-			# Phase 2: Check if we've reached the application page
-			page_type = await check_navigation_complete(browser_session, llm)
-			if page_type == PageType.APPLICATION_PAGE:
-				logger.info('✅ Successfully navigated to application page!')
-				return
-
-			# Phase 3: Plan navigation
-			plan = await plan_navigation(browser_session, llm, browser_state)
-
-			# Phase 4: Get navigation actions
-			actions = await get_navigation_actions(browser_session, llm, tools, browser_state, plan)
+			if browser_state is None:
+				# Phase 1: Read DOM - Get browser state
+				browser_state = await prepare_navigation_context(browser_session)
+
+				# Phase 2: Check if we've reached the application page
+				page_type = await check_navigation_complete(browser_session, llm, browser_state, pipeline_state)
+				if page_type is PageType.APPLICATION_PAGE:
+					logger.info('✅ Successfully navigated to application page!')
+					return page_type
+
+			# Phase 3: Plan navigation and select this step's actions in one LLM call
+			previous_plan, actions = await plan_and_get_navigation_actions(
+				browser_session, llm, tools, browser_state, previous_plan
+			)
 
-			# Phase 5: Execute actions
+			# Phase 4: Execute actions (the next step reads the state again)
+			browser_state = None
 			results = await execute_navigation_actions(browser_session, tools, actions)
 
 			# Check for errors
 			if results and any(r.error for r in results):
 				consecutive_failures += 1
-				logger.warning(f'⚠️ Navigation step failed. Consecutive failures: {consecutive_failures}')
+				logger.warning('⚠️ Navigation step failed. Consecutive failures: %d', consecutive_failures)
 				if consecutive_failures >= max_failures:
 					logger.error(f'❌ Navigation failed after {max_failures} consecutive failures')
 					raise RuntimeError('Navigation failed: too many consecutive failures')
+				await asyncio.sleep(retry_delay(consecutive_failures, next(r.error for r in results if r.error)))
 			else:
 				consecutive_failures = 0
 
-			# Wait for page to stabilize after actions
-			if browser_session._dom_watchdog:
-				await browser_session._dom_watchdog.wait_for_page_stability()
-			else:
+			# The next step's prepare_navigation_context waits for the page to stabilize after these actions
+			if not browser_session._dom_watchdog:
 				await asyncio.sleep(1.0)
 
 		except Exception as e:
 			logger.error(f'❌ Navigation step {step + 1} failed: {e}')
+			browser_state = None
 			consecutive_failures += 1
 			if consecutive_failures >= max_failures:
 				raise RuntimeError(f'Navigation failed after {max_failures} consecutive failures: {e}')
+			await asyncio.sleep(retry_delay(consecutive_failures, str(e)))
 
 	# If we get here, we didn't reach the application page
 	raise RuntimeError(f'Failed to navigate to application page after {max_navigation_steps} steps')
@@ -343,18 +364,17 @@ async def navigate_to_next_page(
 	"""
 	try:
 		# Look for "Save and Continue", "Next", "Continue" buttons
-		browser_state = await browser_session.get_browser_state_summary(include_all_form_fields=True)
-		current_url = browser_state.url
+		# Only the URL is compared below, so read it directly instead of serializing the full form state
+		current_url = await browser_session.get_current_page_url()
 
 		# Find navigation button
 		# TODO: Use LLM or heuristics to find the button
 		# For now, stub implementation
 		logger.info('Attempting to navigate to next page (stub)')
 
-		# Wait a bit to see if page changes
-		await asyncio.sleep(1.0)
-		new_browser_state = await browser_session.get_browser_state_summary(include_all_form_fields=True)
-		page_changed = new_browser_state.url != current_url
+		# Give the page a moment to react (returns early once the DOM is quiet)
+		await wait_for_dom_settle(browser_session, max_wait=1.0, quiet_period=0.3)
+		page_changed = await browser_session.get_current_page_url() != current_url
 
 		return NavigationResult(success=True, page_changed=page_changed)
 	except Exception as e:
@@ -1,7 +1,10 @@
 """Page classification step for the job application pipeline."""
 
-from browser_use.job_application.pipeline.page_classification.run import run
-from browser_use.job_application.pipeline.page_classification.schema import PageClassificationOutput
+from browser_use.job_application.pipeline.page_classification.run import classify_and_identify_section, run
+from browser_use.job_application.pipeline.page_classification.schema import (
+	PageClassificationOutput,
+	PageClassificationWithSectionOutput,
+)
 
-__all__ = ['run', 'PageClassificationOutput']
+__all__ = ['run', 'classify_and_identify_section', 'PageClassificationOutput', 'PageClassificationWithSectionOutput']
 
@@ -1,16 +1,25 @@
 """Page classification step implementation."""
 
+import functools
 import importlib.resources
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.views import BrowserStateSummary
-from browser_use.job_application.pipeline.page_classification.schema import PageClassificationOutput
+from browser_use.job_application.pipeline.page_classification.schema import (
+	PageClassificationOutput,
+	PageClassificationWithSectionOutput,
+)
+from browser_use.job_application.pipeline.section_identification.run import (
+	build_prompt as build_section_prompt,
+	section_from_output,
+)
 from browser_use.job_application.pipeline.shared.enums import PageType
-from browser_use.job_application.pipeline.shared.utils import debug_input, format_browser_state_message
+from browser_use.job_application.pipeline.shared.schemas import ApplicationSection
+from browser_use.job_application.pipeline.shared.utils import build_step_messages, cached_ainvoke, debug_input
+from browser_use.job_application.pipeline.state import PipelineState
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import UserMessage
 from browser_use.observability import observe_debug
 
 if TYPE_CHECKING:
@@ -18,9 +27,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Classifications below this confidence are never served from the LLM cache
+MIN_CACHEABLE_CONFIDENCE = 0.8
 
+
+@functools.cache
 def _load_prompt() -> str:
-	"""Load the page classification prompt template."""
+	"""Load the page classification prompt template (read once and cached)."""
 	try:
 		with importlib.resources.files('browser_use.job_application.pipeline.page_classification').joinpath(
 			'prompt.md'
@@ -30,39 +43,108 @@ def _load_prompt() -> str:
 		raise RuntimeError(f'Failed to load page classification prompt: {e}')
 
 
+@functools.cache
+def _build_combined_prompt_head() -> str:
+	"""Build the static part of the combined classification + section identification prompt."""
+	return f"""{_load_prompt()}
+
+**Section identification (only if page_type is application_page):**
+If you classify the page as application_page, also identify the first section to fill and return it in the `section` field, following the instructions below. For any other page type, leave `section` null."""
+
+
+def _is_confident_classification(classification: PageClassificationOutput) -> bool:
+	"""Whether a classification is certain enough to be reused for an unchanged page."""
+	return classification.page_type is not PageType.MISC_JOB_PAGE and classification.confidence >= MIN_CACHEABLE_CONFIDENCE
+
+
 @observe_debug(ignore_input=True, name='classify_page')
 async def run(
 	browser_session: BrowserSession,
 	llm: BaseChatModel,
+	browser_state: Optional[BrowserStateSummary] = None,
+	pipeline_state: Optional[PipelineState] = None,
 ) -> PageType:
 	"""Classify the current page type using LLM.
 	
 	Args:
 		browser_session: Browser session for getting page state
 		llm: LLM for classification
+		browser_state: Optional browser state already fetched by the caller (skips fetching a new one)
+		pipeline_state: Optional pipeline state whose LLM cache lets an unchanged page reuse a recent
+			confident classification
 		
 	Returns:
 		The classified page type
 	"""
-	browser_state = await browser_session.get_browser_state_summary()
+	if browser_state is None:
+		browser_state = await browser_session.get_browser_state_summary()
 
 	# Load prompt template
 	prompt_text = _load_prompt()
 	
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
+	# The classification prompt is the cacheable prefix; only the browser state is fresh
+	messages = build_step_messages(prompt_text, [], browser_state)
+
+	# Call LLM with structured output (an unchanged page reuses a recent confident classification; uncertain
+	# ones are asked again so a retry can get a better answer)
+	classification = await cached_ainvoke(
+		pipeline_state.llm_cache if pipeline_state is not None else None,
+		llm,
+		messages,
+		PageClassificationOutput,
+		cacheable=_is_confident_classification,
+	)
+
+	logger.info(
+		f'Page classified as: {classification.page_type.value} (confidence: {classification.confidence:.2f})'
+	)
+	await debug_input('[DEBUG] Press Enter to continue after page classification...')
+	return classification.page_type
+
+
+
+@observe_debug(ignore_input=True, name='classify_and_identify_section')
+async def classify_and_identify_section(
+	browser_session: BrowserSession,
+	llm: BaseChatModel,
+	pipeline_state: PipelineState,
+	browser_state: Optional[BrowserStateSummary] = None,
+) -> tuple[PageType, Optional[ApplicationSection], list[str]]:
+	"""Classify the current page and, if it is an application page, identify its first section in one LLM call.
+	
+	This saves the separate section identification round-trip when the pipeline lands directly on the
+	application form.
 	
-	# Combine into ONE message
-	combined_content = f"{prompt_text}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
-	messages = [UserMessage(content=combined_content)]
+	Args:
+		browser_session: Browser session for getting page state
+		llm: LLM for classification and section identification
+		pipeline_state: Current pipeline state with previous sections
+		browser_state: Optional browser state already fetched by the caller (skips fetching a new one). Must
+			include all form fields and a screenshot.
+		
+	Returns:
+		Tuple of (the classified page type, the first section to fill or None, list of question texts)
+	"""
+	if browser_state is None:
+		browser_state = await browser_session.get_browser_state_summary(include_all_form_fields=True, include_screenshot=True)
+
+	# Combine both prompt templates - section identification only applies to application pages
+	# The combined head is static and forms the cacheable prefix; the section prompt depends on progress so far
+	messages = build_step_messages(
+		_build_combined_prompt_head(), build_section_prompt(pipeline_state), browser_state, include_screenshot=True
+	)
 
 	# Call LLM with structured output
-	response = await llm.ainvoke(messages, output_format=PageClassificationOutput)
+	response = await llm.ainvoke(messages, output_format=PageClassificationWithSectionOutput)
 	classification = response.completion
 
 	logger.info(
 		f'Page classified as: {classification.page_type.value} (confidence: {classification.confidence:.2f})'
 	)
-	debug_input('[DEBUG] Press Enter to continue after page classification...')
-	return classification.page_type
+	await debug_input('[DEBUG] Press Enter to continue after page classification...')
+
+	if classification.page_type is not PageType.APPLICATION_PAGE or classification.section is None:
+		return classification.page_type, None, []
 
+	section, question_texts = section_from_output(classification.section)
+	return classification.page_type, section, question_texts
@@ -1,7 +1,10 @@
 """Schema for page classification step."""
 
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
+from browser_use.job_application.pipeline.section_identification.schema import SectionIdentificationOutput
 from browser_use.job_application.pipeline.shared.enums import PageType
 
 
@@ -14,3 +17,11 @@ class PageClassificationOutput(BaseModel):
 	confidence: float = Field(ge=0.0, le=1.0, description="Confidence score 0-1")
 	reasoning: str = Field(description="Brief explanation of classification")
 
+
+
+class PageClassificationWithSectionOutput(PageClassificationOutput):
+	"""Output from combined page classification and first section identification."""
+
+	section: Optional[SectionIdentificationOutput] = Field(
+		None, description="First section to fill. Only set when page_type is application_page, otherwise null"
+	)
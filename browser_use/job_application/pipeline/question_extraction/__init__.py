@@ -1,7 +1,19 @@
 """Question extraction step for the job application pipeline."""
 
-from browser_use.job_application.pipeline.question_extraction.run import run
-from browser_use.job_application.pipeline.question_extraction.schema import ApplicationQuestion, QuestionOption
+from browser_use.job_application.pipeline.question_extraction.run import extract_questions, run
+from browser_use.job_application.pipeline.question_extraction.schema import (
+	ApplicationQuestion,
+	QuestionBatchExtractionOutput,
+	QuestionExtractionOutput,
+	QuestionOption,
+)
 
-__all__ = ['run', 'ApplicationQuestion', 'QuestionOption']
+__all__ = [
+	'run',
+	'extract_questions',
+	'ApplicationQuestion',
+	'QuestionOption',
+	'QuestionExtractionOutput',
+	'QuestionBatchExtractionOutput',
+]
 
@@ -1,18 +1,21 @@
 """Question extraction step implementation."""
 
+import functools
 import importlib.resources
 import logging
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AbstractSet, List, Optional
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.views import BrowserStateSummary
-from browser_use.job_application.pipeline.question_extraction.schema import ApplicationQuestion
+from browser_use.job_application.pipeline.question_extraction.schema import (
+	ApplicationQuestion,
+	QuestionBatchExtractionOutput,
+	QuestionExtractionOutput,
+)
 from browser_use.job_application.pipeline.shared.schemas import ApplicationSection
-from browser_use.job_application.pipeline.shared.utils import debug_input, format_browser_state_message
+from browser_use.job_application.pipeline.shared.utils import build_browser_state_message, debug_input
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, UserMessage
 from browser_use.observability import observe_debug
-from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
 	pass
@@ -20,22 +23,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def _load_prompt() -> str:
-	"""Load the question extraction prompt template."""
+@functools.cache
+def _load_prompt(filename: str = 'prompt.md') -> str:
+	"""Load a question extraction prompt template (read once and cached)."""
 	try:
 		with importlib.resources.files('browser_use.job_application.pipeline.question_extraction').joinpath(
-			'prompt.md'
+			filename
 		).open('r', encoding='utf-8') as f:
 			return f.read()
 	except Exception as e:
 		raise RuntimeError(f'Failed to load question extraction prompt: {e}')
 
 
-def _format_filled_questions(filled_questions: List[str]) -> str:
-	"""Format list of already filled questions for the prompt.
+def _format_filled_questions(filled_questions: AbstractSet[str]) -> str:
+	"""Format the already filled questions for the prompt.
 	
 	Args:
-		filled_questions: List of question texts that have already been filled
+		filled_questions: Set of question texts that have already been filled
 		
 	Returns:
 		Formatted string
@@ -43,25 +47,28 @@ def _format_filled_questions(filled_questions: List[str]) -> str:
 	if not filled_questions:
 		return "None (no questions filled yet in this section)"
 	
-	return '\n'.join(f'- {text}' for text in filled_questions)
+	# Sorted so the same set always produces the same prompt
+	return '\n'.join(f'- {text}' for text in sorted(filled_questions))
 
 
 def _build_prompt(
 	section: ApplicationSection, 
 	question_texts: List[str],
-	filled_questions: List[str],
+	filled_questions: AbstractSet[str],
+	prompt_file: str = 'prompt.md',
 ) -> str:
 	"""Build the question extraction prompt.
 	
 	Args:
 		section: The section to extract questions from
 		question_texts: List of all question texts identified in section identification step
-		filled_questions: List of question texts that have already been filled
+		filled_questions: Set of question texts that have already been filled
+		prompt_file: Prompt template to use (prompt.md for the next question, batch_prompt.md for all of them)
 		
 	Returns:
 		Formatted prompt string
 	"""
-	template = _load_prompt()
+	template = _load_prompt(prompt_file)
 
 	section_type = section.section_type.value
 	section_name = section.name or 'Unnamed'
@@ -88,7 +95,8 @@ async def run(
 	llm: BaseChatModel,
 	section: ApplicationSection,
 	question_texts: List[str],
-	filled_questions: List[str],
+	filled_questions: AbstractSet[str],
+	browser_state: Optional[BrowserStateSummary] = None,
 ) -> Optional[ApplicationQuestion]:
 	"""Identify the next question in a section that hasn't been filled yet.
 	
@@ -97,63 +105,74 @@ async def run(
 		llm: LLM for question extraction
 		section: The section to extract questions from
 		question_texts: List of all question texts identified in section identification step
-		filled_questions: List of question texts that have already been filled in this section
+		filled_questions: Set of question texts that have already been filled in this section
+		browser_state: Optional browser state (with all form fields and a screenshot) already fetched by the caller
 		
 	Returns:
 		The next question to fill, or None if all questions in the section are filled
 	"""
-	browser_state = await browser_session.get_browser_state_summary(include_all_form_fields=True, include_screenshot=True)
+	if browser_state is None:
+		browser_state = await browser_session.get_browser_state_summary(include_all_form_fields=True, include_screenshot=True)
 
 	# Build prompt with section info, question texts, and filled questions
 	prompt_text = _build_prompt(section, question_texts, filled_questions)
 	
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
-	
-	# Combine into ONE message
-	combined_content = f"{prompt_text}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
-	
-	# Create message with screenshot if available
-	if browser_state.screenshot:
-		messages = [UserMessage(
-			content=[
-				ContentPartTextParam(type="text", text=combined_content),
-				ContentPartImageParam(
-					type="image_url",
-					image_url=ImageURL(url=f'data:image/png;base64,{browser_state.screenshot}')
-				)
-			]
-		)]
-	else:
-		messages = [UserMessage(content=combined_content)]
+	# Combine prompt, browser state and screenshot into ONE message
+	messages = [build_browser_state_message(prompt_text, browser_state, include_screenshot=True)]
 
 	# Call LLM with structured output - return single question or None
-	class QuestionOutput(BaseModel):
-		"""Output model for question extraction."""
-
-		model_config = ConfigDict(arbitrary_types_allowed=True, extra='forbid')
-
-		question: Optional[ApplicationQuestion] = Field(
-			None, description='The next question to fill in this section, or None if all questions are filled'
-		)
-		no_more_questions: bool = Field(
-			default=False, description='Set to True if there are no more questions to fill in this section'
-		)
-		rationale: str = Field(
-			description='Explanation of why this question was selected, what element_index was chosen and why, and how it relates to the question text in the DOM. Required even when no_more_questions=True to explain why no question was selected.'
-		)
-
 	try:
-		response = await llm.ainvoke(messages, output_format=QuestionOutput)
+		response = await llm.ainvoke(messages, output_format=QuestionExtractionOutput)
 		output = response.completion
 		
 		if output.no_more_questions or output.question is None:
 			logger.info('No more questions to extract in this section')
 			return None
 		
-		debug_input(f'[DEBUG] Press Enter to continue after question extraction: "{output.question.question_text}" (element_index: {output.question.element_index})...')
+		await debug_input(f'[DEBUG] Press Enter to continue after question extraction: "{output.question.question_text}" (element_index: {output.question.element_index})...')
 		return output.question
 	except Exception as e:
 		logger.error(f'Failed to identify next question: {e}')
 		return None
 
+
+@observe_debug(ignore_input=True, name='extract_questions')
+async def extract_questions(
+	browser_session: BrowserSession,
+	llm: BaseChatModel,
+	section: ApplicationSection,
+	question_texts: List[str],
+	filled_questions: AbstractSet[str],
+	browser_state: Optional[BrowserStateSummary] = None,
+) -> List[ApplicationQuestion]:
+	"""Identify all questions in a section that are visible and not filled yet, in one LLM call.
+	
+	Args:
+		browser_session: Browser session for getting page state
+		llm: LLM for question extraction
+		section: The section to extract questions from
+		question_texts: List of all question texts identified in section identification step
+		filled_questions: Set of question texts that have already been filled in this section
+		browser_state: Optional browser state (with all form fields and a screenshot) already fetched by the caller
+		
+	Returns:
+		The unfilled questions in DOM order (empty if all questions in the section are filled)
+	"""
+	if browser_state is None:
+		browser_state = await browser_session.get_browser_state_summary(include_all_form_fields=True, include_screenshot=True)
+
+	prompt_text = _build_prompt(section, question_texts, filled_questions, prompt_file='batch_prompt.md')
+	messages = [build_browser_state_message(prompt_text, browser_state, include_screenshot=True)]
+
+	try:
+		response = await llm.ainvoke(messages, output_format=QuestionBatchExtractionOutput)
+		questions = [question for question in response.completion.questions if question.question_text not in filled_questions]
+		if not questions:
+			logger.info('No more questions to extract in this section')
+			return []
+
+		await debug_input(f'[DEBUG] Press Enter to continue after extracting {len(questions)} question(s)...')
+		return questions
+	except Exception as e:
+		logger.error(f'Failed to extract questions: {e}')
+		return []
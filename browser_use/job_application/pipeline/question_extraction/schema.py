@@ -32,3 +32,33 @@ class ApplicationQuestion(BaseModel):
 	validation_pattern: Optional[str] = Field(None, description="Validation pattern if visible in DOM")
 	depends_on: Optional[str] = Field(None, description="Question this depends on (for conditional questions)")
 
+
+
+class QuestionExtractionOutput(BaseModel):
+	"""Output model for question extraction."""
+
+	model_config = ConfigDict(arbitrary_types_allowed=True, extra='forbid')
+
+	question: Optional[ApplicationQuestion] = Field(
+		None, description='The next question to fill in this section, or None if all questions are filled'
+	)
+	no_more_questions: bool = Field(
+		default=False, description='Set to True if there are no more questions to fill in this section'
+	)
+	rationale: str = Field(
+		description='Explanation of why this question was selected, what element_index was chosen and why, and how it relates to the question text in the DOM. Required even when no_more_questions=True to explain why no question was selected.'
+	)
+
+
+class QuestionBatchExtractionOutput(BaseModel):
+	"""Output model for extracting all unfilled questions of a section at once."""
+
+	model_config = ConfigDict(arbitrary_types_allowed=True, extra='forbid')
+
+	questions: List[ApplicationQuestion] = Field(
+		default_factory=list,
+		description='All visible questions in this section that still need to be filled, in DOM order. Empty if all questions are filled',
+	)
+	rationale: str = Field(
+		description='Explanation of which questions were selected, what element_index was chosen for each and why. Required even when the list is empty to explain why no question was selected.'
+	)
@@ -1,6 +1,6 @@
 """Question filling step implementation."""
 
-import asyncio
+import functools
 import importlib.resources
 import logging
 from typing import TYPE_CHECKING, List, Optional
@@ -10,9 +10,15 @@ from browser_use.browser.views import BrowserStateSummary
 from browser_use.job_application.pipeline.question_extraction.schema import ApplicationQuestion
 from browser_use.job_application.pipeline.question_filling.schema import FillResult
 from browser_use.job_application.pipeline.shared.schemas import QuestionAnswer
-from browser_use.job_application.pipeline.shared.utils import debug_input, format_browser_state_message
+from browser_use.job_application.pipeline.shared.utils import (
+	action_name,
+	build_step_messages,
+	debug_input,
+	get_page_actions,
+	needs_dom_settle,
+	wait_for_dom_settle,
+)
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, UserMessage
 from browser_use.tools.registry.views import ActionModel
 from browser_use.tools.service import Tools
 from browser_use.agent.views import AgentOutput, ActionResult
@@ -24,8 +30,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
 def _load_filling_prompt() -> str:
-	"""Load the question filling prompt template."""
+	"""Load the question filling prompt template (read once and cached)."""
 	try:
 		with importlib.resources.files('browser_use.job_application.pipeline.question_filling').joinpath(
 			'prompt.md'
@@ -117,6 +124,55 @@ def _format_action_history(action_history: List[dict]) -> str:
 	return "\n".join(lines)
 
 
+@functools.cache
+def _build_actions_prompt(actions_description: str) -> str:
+	"""Build the available-actions instructions of the fill prompt (cached per available action set)."""
+	return f"""<available_actions>
+{actions_description}
+</available_actions>
+
+Return your assessment (is_filled, reasoning) and selected actions."""
+
+
+class QuestionFillAgentOutput(AgentOutput):
+	"""AgentOutput extended with the fill assessment (is_filled, reasoning)."""
+
+	is_filled: bool = Field(description="Whether the question is already filled correctly. Check the screenshot and DOM to verify.")
+	reasoning: Optional[str] = Field(None, description="Brief explanation of why the question is or isn't filled (if not filled, explain what's missing)")
+	
+	@classmethod
+	def model_json_schema(cls, **kwargs):
+		schema = super().model_json_schema(**kwargs)
+		# Remove thinking field
+		if 'thinking' in schema.get('properties', {}):
+			del schema['properties']['thinking']
+		# Make action optional (can be empty if already filled)
+		if 'required' in schema:
+			schema['required'] = [f for f in schema['required'] if f != 'action']
+		return schema
+
+
+@functools.cache
+def _fill_output_type(action_model: type[ActionModel]) -> type[QuestionFillAgentOutput]:
+	"""Build the QuestionFillAgentOutput type for the given action model (built once per action model).
+	
+	Action models are themselves cached per page origin, so every question filled on a site reuses one type.
+	"""
+	return create_model(
+		'QuestionFillAgentOutput',
+		__base__=QuestionFillAgentOutput,
+		action=(
+			list[action_model],  # type: ignore
+			Field(
+				default_factory=list,
+				description='List of actions to execute (empty if already filled)',
+				json_schema_extra={'min_items': 0}
+			),
+		),
+		__module__=QuestionFillAgentOutput.__module__,
+	)
+
+
 async def get_question_fill_output(
 	browser_session: BrowserSession,
 	llm: BaseChatModel,
@@ -140,81 +196,25 @@ async def get_question_fill_output(
 	Returns:
 		Tuple of (is_filled, actions, reasoning)
 	"""
-	logger.debug(f'🤖 Getting fill assessment and actions for question: "{question.question_text}"...')
+	logger.debug('🤖 Getting fill assessment and actions for question: "%s"...', question.question_text)
 
-	# Get available actions for this page
-	page_filtered_actions = tools.registry.get_prompt_description(browser_state.url)
-	actions_description = page_filtered_actions if page_filtered_actions else 'Available actions: click, input, upload_file, select_dropdown, etc.'
+	# Get available actions for this page (cached per page origin)
+	page_actions = get_page_actions(tools, browser_state.url)
+	actions_description = page_actions.description if page_actions.description else 'Available actions: click, input, upload_file, select_dropdown, etc.'
 
 	# Build combined prompt using template
 	prompt_text = _build_filling_prompt(question, answer)
 	
-	# Format action history if provided
-	history_text = ""
+	# Prompt parts: question-specific prompt and action history (if any)
+	prompt_parts = [prompt_text]
 	if action_history:
-		history_text = f"\n\n{_format_action_history(action_history)}\n"
-	
-	action_prompt_content = f"""{prompt_text}{history_text}
+		prompt_parts.append(_format_action_history(action_history))
 
-<available_actions>
-{actions_description}
-</available_actions>
+	# The cached available-actions instructions form the cacheable prefix; question, state and screenshot are fresh
+	messages = build_step_messages(_build_actions_prompt(actions_description), prompt_parts, browser_state, include_screenshot=True)
 
-Return your assessment (is_filled, reasoning) and selected actions."""
-
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
-	
-	# Combine into ONE message with screenshot
-	combined_content = f"{action_prompt_content}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
-	
-	# Create message with screenshot if available
-	if browser_state.screenshot:
-		messages = [UserMessage(
-			content=[
-				ContentPartTextParam(type="text", text=combined_content),
-				ContentPartImageParam(
-					type="image_url",
-					image_url=ImageURL(url=f'data:image/png;base64,{browser_state.screenshot}')
-				)
-			]
-		)]
-	else:
-		messages = [UserMessage(content=combined_content)]
-
-	# Create combined output model
-	ActionModel = tools.registry.create_action_model(page_url=browser_state.url)
-	
-	# Create a model that extends AgentOutput with is_filled and reasoning
-	
-	class QuestionFillAgentOutput(AgentOutput):
-		is_filled: bool = Field(description="Whether the question is already filled correctly. Check the screenshot and DOM to verify.")
-		reasoning: Optional[str] = Field(None, description="Brief explanation of why the question is or isn't filled (if not filled, explain what's missing)")
-		
-		@classmethod
-		def model_json_schema(cls, **kwargs):
-			schema = super().model_json_schema(**kwargs)
-			# Remove thinking field
-			if 'thinking' in schema.get('properties', {}):
-				del schema['properties']['thinking']
-			# Make action optional (can be empty if already filled)
-			if 'required' in schema:
-				schema['required'] = [f for f in schema['required'] if f != 'action']
-			return schema
-	
-	CombinedOutputType = create_model(
-		'QuestionFillAgentOutput',
-		__base__=QuestionFillAgentOutput,
-		action=(
-			list[ActionModel],
-			Field(
-				default_factory=list,
-				description='List of actions to execute (empty if already filled)',
-				json_schema_extra={'min_items': 0}
-			),
-		),
-		__module__=QuestionFillAgentOutput.__module__,
-	)
+	# Combined output model with the actions available on the current page (cached per action model)
+	CombinedOutputType = _fill_output_type(page_actions.action_model)
 
 	try:
 		response = await llm.ainvoke(messages, output_format=CombinedOutputType)
@@ -223,11 +223,11 @@ Return your assessment (is_filled, reasoning) and selected actions."""
 		actions = output.action if output.action else []
 		reasoning = output.reasoning
 		
-		logger.info(f'📊 Assessment: is_filled={is_filled}, actions={len(actions)}')
+		logger.info('📊 Assessment: is_filled=%s, actions=%d', is_filled, len(actions))
 		if reasoning:
-			logger.debug(f'💭 Reasoning: {reasoning}')
+			logger.debug('💭 Reasoning: %s', reasoning)
 		
-		debug_input(f'[DEBUG] Press Enter to continue after question fill assessment and action selection (filled={is_filled}, {len(actions)} actions) for: "{question.question_text[:50]}..."...')
+		await debug_input(f'[DEBUG] Press Enter to continue after question fill assessment and action selection (filled={is_filled}, {len(actions)} actions) for: "{question.question_text[:50]}..."...')
 		return is_filled, actions, reasoning
 	except Exception as e:
 		logger.error(f'Failed to get question fill output: {e}')
@@ -249,12 +249,14 @@ async def execute_actions(
 	Returns:
 		List of action results
 	"""
-	logger.info(f'⚡ Executing {len(actions)} action(s)...')
+	logger.info('⚡ Executing %d action(s)...', len(actions))
 
 	results = []
+	action_names = [action_name(action) for action in actions]
 	for i, action in enumerate(actions):
 		try:
-			logger.info(f'Executing action {i + 1}/{len(actions)}: {action.model_dump(exclude_unset=True)}')
+			if logger.isEnabledFor(logging.INFO):
+				logger.info('Executing action %d/%d: %s', i + 1, len(actions), action.model_dump(exclude_unset=True))
 			
 			result = await tools.act(
 				action=action,
@@ -268,14 +270,14 @@ async def execute_actions(
 			results.append(result)
 
 			if result.error:
-				logger.warning(f'⚠️ Action {i + 1} failed: {result.error}')
+				logger.warning('⚠️ Action %d failed: %s', i + 1, result.error)
 			elif result.is_done:
-				logger.info(f'✅ Action {i + 1} completed task')
+				logger.info('✅ Action %d completed task', i + 1)
 				break
 
-			# Wait between actions
-			if i < len(actions) - 1:
-				await asyncio.sleep(0.5)
+			# Let the DOM settle between actions (consecutive text inputs go straight through)
+			if i < len(actions) - 1 and needs_dom_settle(action_names[i], action_names[i + 1]):
+				await wait_for_dom_settle(browser_session, max_wait=0.5, quiet_period=0.1)
 
 		except Exception as e:
 			logger.error(f'❌ Action {i + 1} raised exception: {e}')
@@ -290,6 +292,7 @@ async def run(
 	tools: Tools,
 	question: ApplicationQuestion,
 	answer: QuestionAnswer,
+	browser_state: Optional[BrowserStateSummary] = None,
 ) -> FillResult:
 	"""Fill the answer into the form using LLM-based action selection with retry loop.
 	
@@ -299,6 +302,7 @@ async def run(
 		tools: Tools registry
 		question: The question to fill
 		answer: The answer to fill with
+		browser_state: Optional browser state prefetched by the caller, used for the first fill step
 		
 	Returns:
 		Result of the fill operation
@@ -310,13 +314,14 @@ async def run(
 	try:
 		while step < max_attempts:
 			step += 1
-			logger.info(f'🔄 Fill step {step}/{max_attempts} for question: "{question.question_text}"')
+			logger.info('🔄 Fill step %d/%d for question: "%s"', step, max_attempts, question.question_text)
 			
-			# 1. Read browser state
-			browser_state = await browser_session.get_browser_state_summary(
-				include_all_form_fields=True,
-				include_screenshot=True
-			)
+			# 1. Read browser state (the first step can reuse the caller's prefetched state)
+			if step > 1 or browser_state is None:
+				browser_state = await browser_session.get_browser_state_summary(
+					include_all_form_fields=True,
+					include_screenshot=True
+				)
 			
 			# 2. Get assessment and actions in one LLM call (with history)
 			is_filled, actions, reasoning = await get_question_fill_output(
@@ -328,7 +333,7 @@ async def run(
 			if is_filled and not actions:
 				logger.info(f'✅ Question already filled correctly: "{question.question_text}"')
 				if reasoning:
-					logger.debug(f'💭 Assessment reasoning: {reasoning}')
+					logger.debug('💭 Assessment reasoning: %s', reasoning)
 				return FillResult(success=True, element_index=question.element_index)
 			
 			# 4. If no actions provided but not filled, log warning and retry
@@ -401,12 +406,12 @@ async def run(
 			if is_filled:
 				logger.info(f'✅ Question filled successfully on step {step}: "{question.question_text}"')
 				if reasoning:
-					logger.debug(f'💭 Assessment reasoning: {reasoning}')
+					logger.debug('💭 Assessment reasoning: %s', reasoning)
 				return FillResult(success=True, element_index=question.element_index)
 			else:
 				logger.warning(f'⚠️ Question not filled correctly after step {step}, retrying...')
 				if reasoning:
-					logger.debug(f'💭 Assessment reasoning: {reasoning}')
+					logger.debug('💭 Assessment reasoning: %s', reasoning)
 				if step < max_attempts:
 					# Wait for DOM stability before next step
 					await browser_session._dom_watchdog.wait_for_page_stability()
@@ -1,7 +1,7 @@
 """Section identification step for the job application pipeline."""
 
-from browser_use.job_application.pipeline.section_identification.run import run
+from browser_use.job_application.pipeline.section_identification.run import build_prompt, run, section_from_output
 from browser_use.job_application.pipeline.section_identification.schema import SectionIdentificationOutput
 
-__all__ = ['run', 'SectionIdentificationOutput']
+__all__ = ['run', 'build_prompt', 'section_from_output', 'SectionIdentificationOutput']
 
@@ -1,5 +1,6 @@
 """Section identification step implementation."""
 
+import functools
 import importlib.resources
 import logging
 from typing import TYPE_CHECKING, Optional
@@ -9,10 +10,9 @@ from browser_use.browser.views import BrowserStateSummary
 from browser_use.job_application.pipeline.section_identification.schema import SectionIdentificationOutput
 from browser_use.job_application.pipeline.shared.enums import SectionType
 from browser_use.job_application.pipeline.shared.schemas import ApplicationSection
-from browser_use.job_application.pipeline.shared.utils import debug_input, format_browser_state_message
+from browser_use.job_application.pipeline.shared.utils import build_browser_state_message, cached_ainvoke, debug_input
 from browser_use.job_application.pipeline.state import PipelineState
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, UserMessage
 from browser_use.observability import observe_debug
 
 if TYPE_CHECKING:
@@ -21,8 +21,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
 def _load_prompt() -> str:
-	"""Load the section identification prompt template."""
+	"""Load the section identification prompt template (read once and cached)."""
 	try:
 		with importlib.resources.files('browser_use.job_application.pipeline.section_identification').joinpath(
 			'prompt.md'
@@ -32,7 +33,7 @@ def _load_prompt() -> str:
 		raise RuntimeError(f'Failed to load section identification prompt: {e}')
 
 
-def _build_prompt(pipeline_state: PipelineState) -> str:
+def build_prompt(pipeline_state: PipelineState) -> str:
 	"""Build the section identification prompt with formatted previous sections.
 	
 	Args:
@@ -64,6 +65,37 @@ def _build_prompt(pipeline_state: PipelineState) -> str:
 	return template.format(previous_sections=previous_sections_str)
 
 
+def section_from_output(section_output: SectionIdentificationOutput) -> tuple[Optional[ApplicationSection], list[str]]:
+	"""Convert section identification output into an ApplicationSection and its question texts.
+	
+	Args:
+		section_output: Structured output from the section identification LLM call
+		
+	Returns:
+		Tuple of (the identified section or None if there are no more sections, list of question texts)
+	"""
+	# Check if LLM indicates no more sections
+	if section_output.no_more_sections:
+		logger.info('No more sections to identify on this page')
+		return None, []
+	
+	# Validate that section_type is provided when no_more_sections is False
+	if section_output.section_type is None:
+		logger.warning('Section identification returned no section_type but no_more_sections is False')
+		return None, []
+	
+	# Convert to ApplicationSection (without question_texts) for return type
+	section = ApplicationSection(
+		section_type=section_output.section_type,
+		name=section_output.name,
+		section_index=section_output.section_index,
+		is_complete=section_output.is_complete,
+		has_errors=section_output.has_errors,
+		element_indices=section_output.element_indices,
+	)
+	return section, section_output.question_texts
+
+
 @observe_debug(ignore_input=True, name='identify_next_section')
 async def run(
 	browser_session: BrowserSession,
@@ -83,55 +115,21 @@ async def run(
 	browser_state = await browser_session.get_browser_state_summary(include_all_form_fields=True, include_screenshot=True)
 
 	# Build prompt with formatted previous sections
-	prompt_text = _build_prompt(pipeline_state)
-	
-	# Format browser state using shared utility
-	browser_state_text = format_browser_state_message(browser_state)
-	
-	# Combine into ONE message with screenshot
-	combined_content = f"{prompt_text}\n\n<browser_state>\n{browser_state_text}\n</browser_state>"
+	prompt_text = build_prompt(pipeline_state)
 	
-	# Create message with screenshot if available
-	if browser_state.screenshot:
-		messages = [UserMessage(
-			content=[
-				ContentPartTextParam(type="text", text=combined_content),
-				ContentPartImageParam(
-					type="image_url",
-					image_url=ImageURL(url=f'data:image/png;base64,{browser_state.screenshot}')
-				)
-			]
-		)]
-	else:
-		messages = [UserMessage(content=combined_content)]
-
-	# Call LLM with structured output
+	# Combine prompt, browser state and screenshot into ONE message
+	messages = [build_browser_state_message(prompt_text, browser_state, include_screenshot=True)]
+
+	# Call LLM with structured output (same prompt over the same page, e.g. a retry spin where nothing changed,
+	# reuses the recent answer)
 	try:
-		response = await llm.ainvoke(messages, output_format=SectionIdentificationOutput)
-		section_output = response.completion
-		
-		# Check if LLM indicates no more sections
-		if section_output.no_more_sections:
-			logger.info('No more sections to identify on this page')
+		section_output = await cached_ainvoke(pipeline_state.llm_cache, llm, messages, SectionIdentificationOutput)
+		section, question_texts = section_from_output(section_output)
+		if section is None:
 			return None, []
 		
-		# Validate that section_type is provided when no_more_sections is False
-		if section_output.section_type is None:
-			logger.warning('Section identification returned no section_type but no_more_sections is False')
-			return None, []
-		
-		# Convert to ApplicationSection (without question_texts) for return type
-		section = ApplicationSection(
-			section_type=section_output.section_type,
-			name=section_output.name,
-			section_index=section_output.section_index,
-			is_complete=section_output.is_complete,
-			has_errors=section_output.has_errors,
-			element_indices=section_output.element_indices,
-		)
-		
-		debug_input(f'[DEBUG] Press Enter to continue after section identification: {section.name or section.section_type.value}...')
-		return section, section_output.question_texts
+		await debug_input(f'[DEBUG] Press Enter to continue after section identification: {section.name or section.section_type.value}...')
+		return section, question_texts
 	except Exception as e:
 		logger.error(f'Failed to identify section: {e}')
 		# Return None if all sections are complete or error occurred
@@ -1,14 +1,18 @@
 """Main pipeline service for job application automation."""
 
+import asyncio
+import collections
+import functools
 import logging
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, FrozenSet, List, Optional, Tuple
 
 from browser_use.browser import BrowserSession
+from browser_use.browser.views import BrowserStateSummary
 from browser_use.job_application.pipeline.account_creation import run as handle_account_creation
-from browser_use.job_application.pipeline.answer_generation import run as generate_answer
+from browser_use.job_application.pipeline.answer_generation import run as generate_answer, run_batch as generate_answers
 from browser_use.job_application.pipeline.navigation import navigate_to_next_page, run as navigate_to_application
-from browser_use.job_application.pipeline.page_classification import run as classify_page
-from browser_use.job_application.pipeline.question_extraction import run as identify_questions_in_section
+from browser_use.job_application.pipeline.page_classification import classify_and_identify_section
+from browser_use.job_application.pipeline.question_extraction import extract_questions
 from browser_use.job_application.pipeline.question_filling import run as fill_answer
 from browser_use.job_application.pipeline.section_identification import run as identify_next_section
 from browser_use.job_application.pipeline.shared.enums import PageType
@@ -18,7 +22,8 @@ from browser_use.job_application.pipeline.shared.schemas import (
 	ApplicationSection,
 	QuestionAnswer,
 )
-from browser_use.job_application.pipeline.state import PipelineState, QuestionWithAnswer, SectionWithQuestions
+from browser_use.job_application.pipeline.shared.utils import get_page_actions, warm_up
+from browser_use.job_application.pipeline.state import PipelineState
 from browser_use.job_application.websocket.client import AnswerGeneratorClient
 from browser_use.llm.base import BaseChatModel
 from browser_use.observability import observe
@@ -30,6 +35,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# ApplicationResult fields for page types that end the pipeline without filling anything
+_TERMINAL_PAGE_RESULTS: Dict[PageType, Dict[str, Any]] = {
+	PageType.CONFIRMATION_PAGE: {'success': True, 'completed': True},
+	PageType.ALREADY_APPLIED_PAGE: {'success': True, 'already_applied': True},
+	PageType.EXPIRATION_PAGE: {'success': False, 'error': 'Job posting has expired'},
+	PageType.UNRELATED_PAGE: {'success': False, 'error': 'Navigated to unrelated page'},
+	PageType.MAINTENANCE_PAGE: {'success': False, 'error': 'Site is under maintenance'},
+}
+
+
+@functools.cache
+def _shared_tools(exclude_actions: Tuple[str, ...] = ()) -> Tools:
+	"""Process-wide Tools registry for the given excluded actions.
+
+	Tools keeps no per-session state, so pipelines share one instance per exclusion set. The page-actions
+	cache is keyed by Tools, so the action models and structured output types built for a site are then reused
+	by every later pipeline instead of being rebuilt per instance.
+	"""
+	return Tools(exclude_actions=list(exclude_actions))
+
+
+def _interactive_element_ids(browser_state: BrowserStateSummary) -> FrozenSet[int]:
+	"""Indices of the interactive elements in a browser state, used to notice form fields appearing."""
+	return frozenset(browser_state.dom_state.selector_map)
+
 
 class JobApplicationPipeline:
 	"""Multi-step pipeline for filling out job applications."""
@@ -61,100 +91,131 @@ class JobApplicationPipeline:
 		self.user_profile = user_profile or {}
 		self.state = PipelineState()
 		self.logger = logging.getLogger(__name__)
-		# Initialize Tools for navigation actions
-		self.tools = Tools()
-		# Initialize Tools for question filling (excludes search action)
-		self.question_filling_tools = Tools(exclude_actions=['search'])
+		# Tools for navigation actions
+		self.tools = _shared_tools()
+		# Tools for question filling (excludes search action)
+		self.question_filling_tools = _shared_tools(('search',))
+		warm_up()
+
+	def _warm_page_actions(self, page_url: str) -> None:
+		"""Build (and cache) the action models both Tools registries need on the given page.
+
+		Runs in a worker thread; the page actions cache is lock-guarded for that.
+		"""
+		get_page_actions(self.tools, page_url).warm()
+		get_page_actions(self.question_filling_tools, page_url)
 
 	@observe(name='pipeline.run', ignore_input=True, ignore_output=True)
 	async def run(self) -> ApplicationResult:
-		"""Main pipeline execution loop."""
+		"""Main pipeline execution loop.
+
+		Holds the answer generator websocket open for the whole application so every question reuses one
+		connection.
+		"""
+		if self.answer_generator_client is None:
+			return await self._run()
+
 		try:
-			# Step 1: Classify current page
-			page_type = await classify_page(self.browser_session, self.llm)
+			await self.answer_generator_client.connect()
+		except Exception as e:
+			self.logger.warning('Failed to connect to answer generator websocket: %s', e)
+		try:
+			return await self._run()
+		finally:
+			await self.answer_generator_client.disconnect()
+
+	async def _run(self) -> ApplicationResult:
+		"""Classify the page, route to navigation/account creation as needed, then fill the application."""
+		try:
+			# Build the starting page's action models in a worker thread while the first LLM call is in flight
+			warm_task = asyncio.create_task(
+				asyncio.to_thread(self._warm_page_actions, await self.browser_session.get_current_page_url())
+			)
+
+			# Step 1: Classify current page (and identify the first section if already on the application form)
+			try:
+				browser_state = await self.browser_session.get_browser_state_summary(
+					include_all_form_fields=True, include_screenshot=True
+				)
+				page_type, first_section, first_question_texts = await classify_and_identify_section(
+					self.browser_session, self.llm, self.state, browser_state=browser_state
+				)
+			finally:
+				await asyncio.gather(warm_task, return_exceptions=True)
 			self.state.current_page_type = page_type
 			self.state.page_classification_history.append(page_type)
 
 			# Step 2: Route based on page type
-			if page_type == PageType.JOB_DESCRIPTION or page_type == PageType.MISC_JOB_PAGE:
-				await navigate_to_application(self.browser_session, self.llm, self.tools, self.state)
-				# Re-classify after navigation
-				page_type = await classify_page(self.browser_session, self.llm)
+			if page_type is PageType.JOB_DESCRIPTION or page_type is PageType.MISC_JOB_PAGE:
+				# Nothing has acted on the page since classification, so navigation starts from the same state
+				# Navigation classifies the page it ends on, so no re-classification is needed;
+				# fill_application identifies the first section itself
+				page_type = await navigate_to_application(
+					self.browser_session, self.llm, self.tools, self.state, browser_state=browser_state
+				)
+				first_section, first_question_texts = None, None
 				self.state.current_page_type = page_type
 
 			# Handle account creation/sign-in if needed
-			if page_type == PageType.ACCOUNT_CREATION:
-				await handle_account_creation(
+			if page_type is PageType.ACCOUNT_CREATION:
+				# Account creation classifies the page it ends on, so no re-classification is needed
+				page_type = await handle_account_creation(
 					self.browser_session, self.llm, self.tools, self.state, self.email, self.password
 				)
-				# Re-classify after account creation
-				page_type = await classify_page(self.browser_session, self.llm)
+				first_section, first_question_texts = None, None
 				self.state.current_page_type = page_type
 
-			if page_type == PageType.APPLICATION_PAGE:
-				return await self.fill_application()
-			elif page_type == PageType.CONFIRMATION_PAGE:
-				return ApplicationResult(
-					success=True,
-					completed=True,
-					sections=self.state.sections,
-					questions_answered=len(self.state.get_all_question_answers()),
-					sections_completed=len(self.state.get_completed_sections()),
-				)
-			elif page_type == PageType.ALREADY_APPLIED_PAGE:
-				return ApplicationResult(
-					success=True,
-					already_applied=True,
-					sections=self.state.sections,
-					questions_answered=len(self.state.get_all_question_answers()),
-					sections_completed=len(self.state.get_completed_sections()),
-				)
-			elif page_type == PageType.EXPIRATION_PAGE:
-				return ApplicationResult(
-					success=False,
-					error='Job posting has expired',
-					sections=self.state.sections,
-				)
-			elif page_type == PageType.UNRELATED_PAGE:
-				return ApplicationResult(
-					success=False,
-					error='Navigated to unrelated page',
-					sections=self.state.sections,
-				)
-			elif page_type == PageType.MAINTENANCE_PAGE:
-				return ApplicationResult(
-					success=False,
-					error='Site is under maintenance',
-					sections=self.state.sections,
-				)
-			else:
-				return ApplicationResult(
-					success=False,
-					error=f'Unexpected page type: {page_type}',
-					sections=self.state.sections,
-				)
+			if page_type is PageType.APPLICATION_PAGE:
+				return await self.fill_application(first_section=first_section, first_question_texts=first_question_texts)
+
+			terminal_result = _TERMINAL_PAGE_RESULTS.get(page_type)
+			if terminal_result is None:
+				terminal_result = {'success': False, 'error': f'Unexpected page type: {page_type.value}'}
+			return self._build_result(**terminal_result)
 
 		except Exception as e:
-			self.logger.error(f'Pipeline error: {e}', exc_info=True)
-			return ApplicationResult(
-				success=False,
-				error=str(e),
-				sections=self.state.sections,
-			)
+			self.logger.error('Pipeline error: %s', e, exc_info=True)
+			return self._build_result(success=False, error=str(e))
+
+	def _build_result(self, **fields: Any) -> ApplicationResult:
+		"""Build an ApplicationResult from the current state, reading the running progress counters.
+
+		Sections are flattened to plain dicts so the result serializes without walking the state objects.
+		"""
+		return ApplicationResult(
+			sections=self.state.to_serializable(),
+			questions_answered=self.state.answered_count,
+			sections_completed=self.state.completed_sections_count,
+			**fields,
+		)
 
 	@time_execution_async('--fill_application')
-	async def fill_application(self) -> ApplicationResult:
-		"""Main application filling loop."""
+	async def fill_application(
+		self,
+		first_section: Optional[ApplicationSection] = None,
+		first_question_texts: Optional[List[str]] = None,
+	) -> ApplicationResult:
+		"""Main application filling loop.
+
+		Args:
+			first_section: Section already identified together with page classification, used for the first iteration
+			first_question_texts: Question texts of first_section
+		"""
 		max_iterations = 50  # Safety limit
 		iteration = 0
 
 		while iteration < max_iterations:
 			iteration += 1
 
-			# 1. Identify next section
-			section, question_texts = await identify_next_section(
-				self.browser_session, self.llm, self.state
-			)
+			# 1. Identify next section (the first one may come from page classification). Always identified
+			# on the page as the previous section's fills left it, since fills can reveal or change sections
+			if first_section is not None:
+				section, question_texts = first_section, first_question_texts or []
+				first_section = None
+			else:
+				section, question_texts = await identify_next_section(
+					self.browser_session, self.llm, self.state
+				)
 			if section is None:
 				self.logger.info('No more sections to fill on this page, attempting navigation to next page')
 				# Try to navigate to next page
@@ -168,84 +229,108 @@ class JobApplicationPipeline:
 				break
 
 			self.state.current_section = section
-			section_name = section.name or section.section_type.value
-			self.logger.info(f'Working on section: {section_name}')
 
 			# Add section to tracking if not already present
-			section_with_questions = None
-			for existing_section in self.state.sections:
-				if (
-					existing_section.name == section.name
-					and existing_section.type == section.section_type
-					and existing_section.section_index == section.section_index
-				):
-					section_with_questions = existing_section
-					break
-
+			section_with_questions = self.state.find_section(section)
 			if section_with_questions is None:
 				section_with_questions = self.state.add_section(section)
-
-			# 2. Loop: Extract next question → Generate answer → Fill → Repeat
-			while True:
-				# Get list of already filled questions in this section
-				filled_question_texts = [
-					qwa.question_text 
-					for qwa in section_with_questions.questions 
-					if qwa.answer and qwa.answer.filled_successfully
-				]
-				
-				# Extract the next question that needs to be filled
-				question = await identify_questions_in_section(
-					self.browser_session, 
-					self.llm, 
-					section, 
-					question_texts,
-					filled_question_texts,
-				)
-				
-				# If no more questions, mark section as complete and break
-				if question is None:
-					self.logger.info(f'All questions filled in section: {section_name}')
-					section_with_questions.is_complete = True
-					break
-				
-				# Add question to tracking if not already present
-				question_with_answer = None
-				for qwa in section_with_questions.questions:
-					if qwa.question_text == question.question_text:
-						question_with_answer = qwa
+			section_name = section_with_questions.display_name
+			self.logger.info('Working on section: %s', section_name)
+
+			# Drop repeated question texts once here rather than sending them in every extraction prompt
+			question_texts = list(dict.fromkeys(question_texts))
+
+			# Already filled questions in this section (kept on the section, updated as answers are recorded)
+			filled_question_texts = section_with_questions.filled_question_texts
+
+			# 2. Extract the section's unfilled questions in one call, generate all their answers in one batch, then
+			# fill each in turn. The queue is only re-extracted once it runs dry or a fill reveals new form fields
+			# (e.g. a conditional follow-up question). Filling stays sequential since it mutates the page.
+			pending_questions: Deque[ApplicationQuestion] = collections.deque()
+			extracted_element_ids: FrozenSet[int] = frozenset()
+			# Answer batch covering each extracted question text, generated while the first questions are filled.
+			# Batches are kept across re-extractions so answers already generated (or in flight) are reused
+			answer_tasks: Dict[str, asyncio.Task[Dict[str, QuestionAnswer]]] = {}
+			try:
+				while True:
+					# Fresh snapshot of the page as the previous fill left it: serves question extraction and the
+					# fill step's first assessment
+					browser_state = await self.browser_session.get_browser_state_summary(
+						include_all_form_fields=True, include_screenshot=True
+					)
+					element_ids = _interactive_element_ids(browser_state)
+
+					if pending_questions and not element_ids <= extracted_element_ids:
+						self.logger.info('New form fields appeared, re-extracting questions in section: %s', section_name)
+						pending_questions.clear()
+
+					if not pending_questions:
+						pending_questions.extend(
+							await extract_questions(
+								self.browser_session,
+								self.llm,
+								section,
+								question_texts,
+								filled_question_texts,
+								browser_state=browser_state,
+							)
+						)
+						extracted_element_ids = element_ids
+						# Only questions no earlier batch covers need new answers
+						new_questions = [question for question in pending_questions if question.question_text not in answer_tasks]
+						if new_questions:
+							answers_task = asyncio.create_task(self._generate_answers(new_questions))
+							answer_tasks.update((question.question_text, answers_task) for question in new_questions)
+
+					# If no more questions, mark section as complete and break
+					if not pending_questions:
+						self.logger.info('All questions filled in section: %s', section_name)
+						self.state.complete_section(section_with_questions)
 						break
-				
-				if question_with_answer is None:
-					question_with_answer = QuestionWithAnswer.from_question(question)
-					section_with_questions.questions.append(question_with_answer)
-				
-				# Skip if already filled successfully (shouldn't happen, but safety check)
-				if question_with_answer.answer and question_with_answer.answer.filled_successfully:
-					self.logger.info(f'Skipping already filled question: "{question.question_text}"')
-					continue
-				
-				# Generate answer (via websocket to browser extension or LLM)
-				answer = await generate_answer(
-					question, self.llm, self.user_profile, self.answer_generator_client
-				)
-
-				# Fill answer (use question_filling_tools which excludes search)
-				fill_result = await fill_answer(
-					self.browser_session, self.llm, self.question_filling_tools, question, answer
-				)
-
-				# Update answer with fill result
-				answer.filled_successfully = fill_result.success
-				if not fill_result.success:
-					answer.error_message = fill_result.error
-
-				# Update question with answer
-				question_with_answer.answer = answer
 
-				# Handle errors
-				if not fill_result.success:
-					await self.handle_fill_error(question, answer, fill_result.error)
+					question = pending_questions.popleft()
+
+					# Add question to tracking if not already present
+					question_with_answer = section_with_questions.find_question(question.question_text)
+					if question_with_answer is None:
+						question_with_answer = section_with_questions.add_question(question)
+
+					# Skip if already filled successfully (shouldn't happen, but safety check)
+					if question.question_text in filled_question_texts:
+						self.logger.info('Skipping already filled question: "%s"', question.question_text)
+						continue
+
+					# Answer from the batch (via websocket to browser extension or LLM), or generated on its own
+					answers_task = answer_tasks.get(question.question_text)
+					answers = await answers_task if answers_task is not None else {}
+					answer = answers.get(question.question_text)
+					if answer is None:
+						answer = await generate_answer(question, self.llm, self.user_profile, self.answer_generator_client)
+
+					# Fill answer (use question_filling_tools which excludes search)
+					fill_result = await fill_answer(
+						self.browser_session,
+						self.llm,
+						self.question_filling_tools,
+						question,
+						answer,
+						browser_state=browser_state,
+					)
+
+					# Update answer with fill result
+					answer.filled_successfully = fill_result.success
+					if not fill_result.success:
+						answer.error_message = fill_result.error
+
+					# Record the answer and, on failure, its retry count in one state update
+					retry_count = self.state.apply_fill_result(section_with_questions, question_with_answer, answer)
+
+					# Handle errors
+					if not fill_result.success:
+						await self.handle_fill_error(question, answer, fill_result.error, retry_count)
+			finally:
+				for answers_task in set(answer_tasks.values()):
+					answers_task.cancel()
 
 			# 4. Attempt to move to next page
 			navigation_result = await navigate_to_next_page(self.browser_session)
@@ -257,17 +342,16 @@ class JobApplicationPipeline:
 				# Page changed, break to re-classify
 				break
 
-		return ApplicationResult(
-			success=True,
-			completed=True,
-			sections=self.state.sections,
-			questions_answered=len(self.state.get_all_question_answers()),
-			sections_completed=len(self.state.get_completed_sections()),
-		)
+		return self._build_result(success=True, completed=True)
+
+	async def _generate_answers(self, questions: List[ApplicationQuestion]) -> Dict[str, QuestionAnswer]:
+		"""Generate answers for a batch of extracted questions, keyed by question text."""
+		answers = await generate_answers(questions, self.llm, self.user_profile, self.answer_generator_client)
+		return {question.question_text: answer for question, answer in zip(questions, answers)}
 
 	async def resolve_navigation_errors(self, errors: List[str]) -> None:
 		"""Resolve errors preventing navigation."""
-		self.logger.warning(f'Navigation errors detected: {errors}')
+		self.logger.warning('Navigation errors detected: %s', errors)
 		# TODO: Implement error resolution logic
 		# - Check for validation errors
 		# - Identify missing required fields
@@ -275,19 +359,23 @@ class JobApplicationPipeline:
 		# - Retry navigation
 
 	async def handle_fill_error(
-		self, question: ApplicationQuestion, answer: QuestionAnswer, error: str
+		self, question: ApplicationQuestion, answer: QuestionAnswer, error: str, retry_count: int
 	) -> None:
-		"""Handle fill error with retry logic."""
-		retry_count = self.state.increment_failed_question(question.question_text)
+		"""Handle fill error with retry logic.
+
+		Args:
+			question: The question that failed to fill
+			answer: The answer that was attempted
+			error: Error reported by the fill step
+			retry_count: How many times the question has failed, as recorded by PipelineState.apply_fill_result
+		"""
 
 		if retry_count > 3:
-			self.logger.error(
-				f'Question "{question.question_text}" failed {retry_count} times, giving up'
-			)
+			self.logger.error('Question "%s" failed %d times, giving up', question.question_text, retry_count)
 			return
 
 		self.logger.warning(
-			f'Fill error for question "{question.question_text}": {error}. Retry count: {retry_count}'
+			'Fill error for question "%s": %s. Retry count: %d', question.question_text, error, retry_count
 		)
 
 		# TODO: Implement retry logic
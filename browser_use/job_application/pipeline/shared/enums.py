@@ -1,10 +1,16 @@
 """Shared enums for the job application pipeline."""
 
+import functools
+import types
+from collections.abc import Mapping
 from enum import Enum
 
 
-class PageType(str, Enum):
-	"""Types of pages encountered during job application flow."""
+class PageType(Enum):
+	"""Types of pages encountered during job application flow.
+
+	A plain Enum (no str mixin): members are singletons compared with `is`, and use `.value` where a string is needed.
+	"""
 
 	APPLICATION_PAGE = "application_page"
 	EXPIRATION_PAGE = "expiration_page"
@@ -17,9 +23,10 @@ class PageType(str, Enum):
 	ACCOUNT_CREATION = "account_creation"
 
 	@classmethod
-	def get_descriptions(cls) -> dict[str, str]:
-		"""Get descriptions for each page type."""
-		return {
+	@functools.cache
+	def get_descriptions(cls) -> Mapping[str, str]:
+		"""Get descriptions for each page type (built once, read-only)."""
+		return types.MappingProxyType({
 			cls.APPLICATION_PAGE.value: "Active job application form with fields to fill out",
 			cls.EXPIRATION_PAGE.value: "Job posting has expired or is no longer available",
 			cls.CONFIRMATION_PAGE.value: "Application submitted successfully with confirmation message",
@@ -29,7 +36,7 @@ class PageType(str, Enum):
 			cls.ALREADY_APPLIED_PAGE.value: "User has already applied to this job posting",
 			cls.MISC_JOB_PAGE.value: "Other job-related page (search results, company careers page, etc.)",
 			cls.ACCOUNT_CREATION.value: "Account creation or sign-in page that must be completed before applying",
-		}
+		})
 
 
 class SectionType(str, Enum):
@@ -1,13 +1,11 @@
 """Shared schemas for the job application pipeline."""
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from browser_use.job_application.pipeline.shared.enums import QuestionType, SectionType
-
-if TYPE_CHECKING:
-	from browser_use.job_application.pipeline.state import SectionWithQuestions
+from browser_use.tools.registry.views import ActionModel
 
 
 class ApplicationSection(BaseModel):
@@ -62,6 +60,20 @@ class QuestionAnswer(BaseModel):
 	error_message: Optional[str] = Field(None, description="Error message if filling failed")
 
 
+class PlanAndActOutput(BaseModel):
+	"""Output of a combined planning + action selection call (navigation and account creation)."""
+
+	model_config = ConfigDict(arbitrary_types_allowed=True, extra='forbid')
+
+	rationale: str = Field(
+		description="Your reasoning: what page you identified, what elements you observed, and why you chose this plan"
+	)
+	plan: str = Field(description="Concise plan (3-5 steps) for progressing from the current page")
+	action: List[ActionModel] = Field(
+		description="Actions carrying out the first step(s) of the plan", json_schema_extra={'min_items': 1}
+	)
+
+
 class ApplicationResult(BaseModel):
 	"""Result of pipeline execution."""
 
@@ -73,9 +85,8 @@ class ApplicationResult(BaseModel):
 	error: Optional[str] = Field(None, description="Error message if pipeline failed")
 	questions_answered: int = Field(default=0, description="Number of questions answered")
 	sections_completed: int = Field(default=0, description="Number of sections completed")
-	# sections included for user display (hierarchical structure)
-	# Note: SectionWithQuestions is defined in state.py to avoid circular imports
-	sections: List[Any] = Field(
-		default_factory=list, description="All sections with questions and answers (SectionWithQuestions objects)"
+	# sections included for user display (hierarchical structure), flattened by PipelineState.to_serializable
+	sections: List[Dict[str, Any]] = Field(
+		default_factory=list, description="All sections with questions and answers, as plain dicts"
 	)
 
@@ -1,28 +1,151 @@
 """Shared utilities for the job application pipeline."""
 
+import asyncio
+import collections
+import functools
+import hashlib
+import os
+import random
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import urlparse
+
+from pydantic import Field, create_model
+
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.agent.views import AgentOutput
 from browser_use.browser.views import BrowserStateSummary
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.job_application.pipeline.shared.schemas import PlanAndActOutput
+from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
+from browser_use.tools.registry.views import ActionModel
+
+if TYPE_CHECKING:
+	from browser_use.browser import BrowserSession
+	from browser_use.llm.base import BaseChatModel
+	from browser_use.tools.service import Tools
+
+T = TypeVar('T')
 
 # ANSI color codes
 GREEN = '\033[92m'
 RESET = '\033[0m'
 
 
-def debug_input(prompt: str) -> str:
+def _debug_pause_enabled() -> bool:
+	"""Whether interactive debug pauses are enabled via PIPELINE_DEBUG_PAUSE."""
+	return os.getenv('PIPELINE_DEBUG_PAUSE', '').lower() in ('1', 'true', 'yes')
+
+
+async def debug_input(prompt: str) -> str:
 	"""Print a colored debug prompt and wait for user input.
 	
+	No-op unless the PIPELINE_DEBUG_PAUSE environment variable is set. The blocking input() call runs in a
+	worker thread so the event loop (CDP events, watchdogs, websocket traffic) keeps running while paused.
+	
 	Args:
 		prompt: The debug message to display
 		
 	Returns:
-		User input string
+		User input string, or an empty string when debug pauses are disabled
+	"""
+	if not _debug_pause_enabled():
+		return ''
+	return await asyncio.to_thread(input, f'{GREEN}{prompt}{RESET}')
+
+
+async def wait_for_dom_settle(browser_session: 'BrowserSession', max_wait: float, quiet_period: float) -> None:
+	"""Wait until the DOM has had no mutations for quiet_period seconds, for at most max_wait seconds.
+	
+	Replaces fixed sleeps between actions: returns as soon as the page is quiet instead of always idling.
+	Falls back to sleeping max_wait when the DOM watchdog isn't attached.
+	
+	Args:
+		browser_session: Browser session
+		max_wait: Upper bound on the wait in seconds (the old fixed delay)
+		quiet_period: Mutation-free period in seconds that counts as settled
+	"""
+	dom_watchdog = browser_session._dom_watchdog
+	if dom_watchdog is None:
+		await asyncio.sleep(max_wait)
+		return
+	await dom_watchdog.wait_for_dom_stability(max_wait_time=max_wait, stability_period=quiet_period)
+
+
+# Actions that only type into a field - they never open overlays or navigate, so back-to-back
+# text inputs into distinct fields can run without the settle pause used between other actions
+_TEXT_INPUT_ACTIONS = frozenset({'input'})
+
+
+def action_name(action: ActionModel) -> str:
+	"""Get the registered action name of an action model instance (its set field, read without dumping the model)."""
+	return next(iter(action.model_fields_set), 'unknown')
+
+
+def needs_dom_settle(previous_action_name: str, next_action_name: str) -> bool:
+	"""Whether to wait for the DOM to settle between two consecutive actions.
+	
+	Consecutive text inputs go straight through; anything else (clicks, selects, navigation) may re-render
+	the page, so the next action waits for it to settle.
 	"""
-	return input(f'{GREEN}{prompt}{RESET}')
+	return not (previous_action_name in _TEXT_INPUT_ACTIONS and next_action_name in _TEXT_INPUT_ACTIONS)
+
+
+def retry_delay(failure_count: int, error: str = '') -> float:
+	"""Back-off delay before retrying a failed navigation or account creation step.
+	
+	The base delay depends on the kind of error: timeouts get a long wait, network errors a short one and
+	elements that are not yet clickable barely any. Other errors back off exponentially. The result carries
+	±20% jitter.
+	
+	Args:
+		failure_count: Number of consecutive failures so far (1 for the first failure)
+		error: Error text of the failure
+		
+	Returns:
+		Delay in seconds
+	"""
+	error = error.lower()
+	if 'timeout' in error or 'timed out' in error:
+		delay = 2.0
+	elif 'network' in error:
+		delay = 0.5
+	elif 'not clickable' in error:
+		delay = 0.2
+	else:
+		delay = min(2**failure_count * 0.1, 3.0)
+	return delay * random.uniform(0.8, 1.2)
+
+
+@functools.cache
+def _get_file_system() -> FileSystem:
+	"""Return the shared FileSystem used for browser state formatting.
+
+	FileSystem wipes and recreates its data directory on construction, so it is built once per process
+	rather than on every formatting call.
+	"""
+	return FileSystem('./tmp')
+
+
+def warm_up() -> None:
+	"""Do one-time setup of the shared formatting helpers so it doesn't land in the first timed pipeline step."""
+	_get_file_system()
+
+
+# Most recently formatted browser states, matched by identity. A fresh summary is fetched after every action,
+# so identity matches can never serve stale output. A few entries are kept because steps that reuse a caller's
+# state (e.g. the fill step's first assessment) interleave with fresh ones.
+_recent_formatted: collections.deque[tuple[BrowserStateSummary, str]] = collections.deque(maxlen=4)
 
 
 def format_browser_state_message(browser_state: BrowserStateSummary) -> str:
 	"""Format browser state using the same logic as AgentMessagePrompt.
 	
 	This ensures consistent browser state formatting across all pipeline steps.
+	Repeated calls with one of the last few BrowserStateSummary objects return the cached string.
 	
 	Args:
 		browser_state: The browser state summary to format
@@ -30,17 +153,238 @@ def format_browser_state_message(browser_state: BrowserStateSummary) -> str:
 	Returns:
 		Formatted browser state as a string
 	"""
-	from browser_use.agent.prompts import AgentMessagePrompt
-	from browser_use.filesystem.file_system import FileSystem
-	
+	for cached_state, cached_text in _recent_formatted:
+		if cached_state is browser_state:
+			return cached_text
+
 	# Create a minimal AgentMessagePrompt just to use its browser state formatting
 	# FileSystem is required but not used for browser state formatting
-	file_system = FileSystem("./tmp")
 	prompt_helper = AgentMessagePrompt(
 		browser_state_summary=browser_state,
-		file_system=file_system,
+		file_system=_get_file_system(),
 		include_attributes=None,  # Use defaults
 	)
 	
-	return prompt_helper._get_browser_state_description()
+	browser_state_text = prompt_helper._get_browser_state_description()
+	_recent_formatted.append((browser_state, browser_state_text))
+	return browser_state_text
+
+
+class PageActions:
+	"""Actions available on a page: prompt description, action model and the output types built on it.
+
+	Building these walks the registry and creates pydantic models dynamically, so they are cached
+	per Tools instance and page origin (domain filters only look at scheme and host). The service warms
+	them from a worker thread, so the output types are built under _page_actions_lock.
+	"""
+
+	def __init__(self, tools: 'Tools', page_url: str):
+		self.description: str = tools.registry.get_prompt_description(page_url)
+		self.action_model: type[ActionModel] = tools.registry.create_action_model(page_url=page_url)
+		self._plan_and_act_type: type[PlanAndActOutput] | None = None
+		self._actions_only_type: type[AgentOutput] | None = None
+
+	@property
+	def plan_and_act_type(self) -> type[PlanAndActOutput]:
+		"""PlanAndActOutput type restricted to this page's actions."""
+		with _page_actions_lock:
+			if self._plan_and_act_type is None:
+				self._plan_and_act_type = create_model(
+					'PlanAndActOutput',
+					__base__=PlanAndActOutput,
+					action=(list[self.action_model], Field(..., json_schema_extra={'min_items': 1})),  # type: ignore
+					__module__=PlanAndActOutput.__module__,
+				)
+			return self._plan_and_act_type
+
+	@property
+	def actions_only_type(self) -> type[AgentOutput]:
+		"""Action selection output type (no plan) restricted to this page's actions, for when planning fails."""
+		with _page_actions_lock:
+			if self._actions_only_type is None:
+				self._actions_only_type = AgentOutput.type_with_custom_actions_no_thinking(self.action_model)
+			return self._actions_only_type
+
+	def warm(self) -> None:
+		"""Build the output type every plan-and-act step needs, so the first step finds it cached."""
+		_ = self.plan_and_act_type  # built and cached by the property
+
+
+# Guards _page_actions_cache and the lazily built PageActions output types (reentrant: PageActions are built
+# while the cache lookup holds it)
+_page_actions_lock = threading.RLock()
+
+
+_page_actions_cache: 'weakref.WeakKeyDictionary[Tools, dict[tuple[str, str, int], PageActions]]' = (
+	weakref.WeakKeyDictionary()
+)
+
+
+def get_page_actions(tools: 'Tools', page_url: str) -> PageActions:
+	"""Get the (cached) actions available for a page URL.
+	
+	Args:
+		tools: Tools registry
+		page_url: URL of the current page
+		
+	Returns:
+		PageActions for the page's origin
+	"""
+	parsed_url = urlparse(page_url)
+	# Include the action count so actions registered after the first lookup are picked up
+	key = (parsed_url.scheme, parsed_url.netloc, len(tools.registry.registry.actions))
+	with _page_actions_lock:
+		tools_cache = _page_actions_cache.setdefault(tools, {})
+		page_actions = tools_cache.get(key)
+		if page_actions is None:
+			page_actions = tools_cache[key] = PageActions(tools, page_url)
+		return page_actions
+
+
+def build_browser_state_message(
+	prompt_text: str | list[str],
+	browser_state: BrowserStateSummary,
+	include_screenshot: bool = False,
+) -> UserMessage:
+	"""Build the single user message sent by each pipeline step: prompt, browser state and optional screenshot.
+	
+	The prompt and the browser state are separate content parts, so the (cached) prompt string is passed by
+	reference instead of being copied into one large concatenated string on every call. A prompt given as a
+	list becomes one content part per string, so a step can keep its static template cached and send only the
+	dynamic bits as fresh strings.
+	
+	Args:
+		prompt_text: Step-specific prompt, or its parts in order
+		browser_state: Current browser state
+		include_screenshot: Whether to attach the browser state's screenshot (if it has one)
+		
+	Returns:
+		User message for the LLM call
+	"""
+	prompt_parts = [prompt_text] if isinstance(prompt_text, str) else prompt_text
+	content: list[ContentPartTextParam | ContentPartImageParam] = [ContentPartTextParam(text=part) for part in prompt_parts]
+	content.append(
+		ContentPartTextParam(text=f'<browser_state>\n{format_browser_state_message(browser_state)}\n</browser_state>')
+	)
+	if include_screenshot and browser_state.screenshot:
+		content.append(
+			ContentPartImageParam(image_url=ImageURL(url=f'data:image/png;base64,{browser_state.screenshot}'))
+		)
+	return UserMessage(content=content)
+
+
+def build_step_messages(
+	static_prompt: str,
+	prompt_text: str | list[str],
+	browser_state: BrowserStateSummary,
+	include_screenshot: bool = False,
+) -> list[BaseMessage]:
+	"""Build the messages for a step whose instructions do not change between calls.
+	
+	The static instructions go first as a cacheable system message, so every call of the step shares the same
+	prompt prefix and the provider can reuse it (explicit cache breakpoint on Anthropic, automatic prefix
+	caching elsewhere). Only the dynamic prompt parts and the browser state are sent fresh in the user message.
+	
+	Args:
+		static_prompt: Instructions that are identical across calls (should be a cached string)
+		prompt_text: Dynamic prompt, or its parts in order (may be empty)
+		browser_state: Current browser state
+		include_screenshot: Whether to attach the browser state's screenshot (if it has one)
+		
+	Returns:
+		System message followed by the user message for the LLM call
+	"""
+	return [
+		SystemMessage(content=static_prompt, cache=True),
+		build_browser_state_message(prompt_text, browser_state, include_screenshot=include_screenshot),
+	]
+
+
+class LLMResponseCache:
+	"""Completions of recent cacheable LLM calls, keyed by a digest of the request (LRU order, short TTL).
+
+	One instance lives on each PipelineState, so completions are never shared between pipelines or users.
+	"""
+
+	def __init__(self, max_size: int = 16, ttl: float = 30.0):
+		self.max_size = max_size
+		self.ttl = ttl
+		self._entries: collections.OrderedDict[str, tuple[float, Any]] = collections.OrderedDict()
+
+	def get(self, key: str) -> Any:
+		"""Return the completion stored under key, or None if there is none or it has expired."""
+		entry = self._entries.get(key)
+		if entry is None:
+			return None
+		stored_at, completion = entry
+		if time.monotonic() - stored_at > self.ttl:
+			del self._entries[key]
+			return None
+		self._entries.move_to_end(key)
+		return completion
+
+	def put(self, key: str, completion: Any) -> None:
+		"""Store a completion, evicting the least recently used entry when full."""
+		self._entries[key] = (time.monotonic(), completion)
+		self._entries.move_to_end(key)
+		if len(self._entries) > self.max_size:
+			self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		"""Drop all stored completions."""
+		self._entries.clear()
+
+
+def _request_digest(llm: 'BaseChatModel', messages: list[BaseMessage], output_format: type) -> str:
+	"""Digest of model, output format and every content part (text and attached images)."""
+	digest = hashlib.blake2b(digest_size=16)
+	digest.update(f'{llm.provider}:{llm.model}:{output_format.__module__}.{output_format.__qualname__}'.encode())
+	for message in messages:
+		content = message.content if isinstance(message.content, list) else [ContentPartTextParam(text=message.content)]
+		for part in content:
+			if isinstance(part, ContentPartTextParam):
+				digest.update(b'\0t')
+				digest.update(part.text.encode())
+			elif isinstance(part, ContentPartImageParam):
+				digest.update(b'\0i')
+				digest.update(part.image_url.url.encode())
+	return digest.hexdigest()
+
+
+async def cached_ainvoke(
+	cache: LLMResponseCache | None,
+	llm: 'BaseChatModel',
+	messages: list[BaseMessage],
+	output_format: type[T],
+	cacheable: Callable[[T], bool] | None = None,
+) -> T:
+	"""Invoke the LLM with structured output, reusing the completion of an identical recent call.
+	
+	Only for steps whose answer is a function of what they are shown (page classification, section
+	identification): retry loops that spin on an unchanged page then skip the round-trip. The key covers the
+	model, the output format and all content, screenshots included, so a page that looks different is sent
+	again. Entries expire after the cache's TTL so a retry loop eventually gets a fresh answer.
+	
+	Args:
+		cache: Per-pipeline cache to use, or None to always call the LLM
+		llm: LLM to invoke
+		messages: Messages to send
+		output_format: Structured output type
+		cacheable: Optional predicate; completions it rejects (e.g. low confidence) are not stored
+		
+	Returns:
+		The completion (a copy when served from the cache, so callers may modify it)
+	"""
+	if cache is None:
+		response = await llm.ainvoke(messages, output_format=output_format)
+		return response.completion
+
+	key = _request_digest(llm, messages, output_format)
+	completion = cache.get(key)
+	if completion is not None:
+		return completion.model_copy()
 
+	response = await llm.ainvoke(messages, output_format=output_format)
+	if cacheable is None or cacheable(response.completion):
+		cache.put(key, response.completion.model_copy())
+	return response.completion
@@ -1,27 +1,23 @@
 """State tracking for job application pipeline."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from browser_use.job_application.pipeline.question_extraction.schema import ApplicationQuestion
-from browser_use.job_application.pipeline.shared.enums import PageType, QuestionType, SectionType
+from browser_use.job_application.pipeline.shared.enums import PageType, SectionType
 from browser_use.job_application.pipeline.shared.schemas import ApplicationSection, QuestionAnswer
+from browser_use.job_application.pipeline.shared.utils import LLMResponseCache
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionWithAnswer:
-	"""Combines question info and answer."""
-
-	# All fields from ApplicationQuestion
-	question_text: str
-	is_required: bool
-	question_type: QuestionType
-	element_index: int
-	options: List[Any] = field(default_factory=list)
-	options_complete: bool = True
-	section_type: SectionType = SectionType.OTHER
-	validation_pattern: Optional[str] = None
-	depends_on: Optional[str] = None
+	"""Combines question info and answer.
+
+	The extracted question is held by reference rather than copied field by field; read its fields through
+	`question` (question_text is also exposed directly since state lookups key on it).
+	"""
+
+	question: ApplicationQuestion
 
 	# Answer (if filled)
 	answer: Optional[QuestionAnswer] = None
@@ -29,50 +25,108 @@ class QuestionWithAnswer:
 	@classmethod
 	def from_question(cls, question: ApplicationQuestion) -> 'QuestionWithAnswer':
 		"""Create QuestionWithAnswer from ApplicationQuestion."""
-		return cls(
-			question_text=question.question_text,
-			is_required=question.is_required,
-			question_type=question.question_type,
-			element_index=question.element_index,
-			options=question.options,
-			options_complete=question.options_complete,
-			section_type=question.section_type,
-			validation_pattern=question.validation_pattern,
-			depends_on=question.depends_on,
-			answer=None,
-		)
-
-
-@dataclass
+		return cls(question=question)
+
+	@property
+	def question_text(self) -> str:
+		"""The question text as displayed."""
+		return self.question.question_text
+
+
+@dataclass(slots=True)
 class SectionWithQuestions:
-	"""Section with its questions and answers."""
+	"""Section with its questions and answers.
 
-	# All fields from ApplicationSection
-	type: SectionType
-	name: Optional[str] = None
-	section_index: int = 0
-	is_complete: bool = False
-	has_errors: bool = False
-	element_indices: List[int] = field(default_factory=list)
+	The identified section is held by reference; name, type and section_index are exposed as properties.
+	"""
+
+	section: ApplicationSection
 
 	# Questions in this section
 	questions: List[QuestionWithAnswer] = field(default_factory=list)
 
+	# Fill progress, tracked here so the identified section is never mutated
+	is_complete: bool = False
+	has_errors: bool = False
+
+	# Label for logs and lookups by section name: the name, or the type when the section has none
+	display_name: str = field(default='', init=False, repr=False, compare=False)
+
+	# Answers by question_text (kept in sync by _set_answer)
+	answers_by_text: Dict[str, QuestionAnswer] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+	# Texts of questions filled successfully (kept in sync by _set_answer)
+	filled_question_texts: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+	# Index of questions by question_text (kept in sync by add_question)
+	_questions_by_text: Dict[str, QuestionWithAnswer] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+	def __post_init__(self) -> None:
+		self.display_name = self.name or self.type.value
+		self._questions_by_text = {question.question_text: question for question in self.questions}
+		self.answers_by_text = {
+			question.question_text: question.answer for question in self.questions if question.answer is not None
+		}
+		self.filled_question_texts = {
+			question.question_text
+			for question in self.questions
+			if question.answer and question.answer.filled_successfully
+		}
+
 	@classmethod
 	def from_section(cls, section: ApplicationSection) -> 'SectionWithQuestions':
 		"""Create SectionWithQuestions from ApplicationSection."""
-		return cls(
-			type=section.section_type,
-			name=section.name,
-			section_index=section.section_index,
-			is_complete=section.is_complete,
-			has_errors=section.has_errors,
-			element_indices=section.element_indices,
-			questions=[],
-		)
-
-
-@dataclass
+		return cls(section=section, is_complete=section.is_complete, has_errors=section.has_errors)
+
+	@property
+	def type(self) -> SectionType:
+		"""Type of the section."""
+		return self.section.section_type
+
+	@property
+	def name(self) -> Optional[str]:
+		"""Name of the section if present in DOM."""
+		return self.section.name
+
+	@property
+	def section_index(self) -> int:
+		"""Order of the section on the page."""
+		return self.section.section_index
+
+	@property
+	def key(self) -> Tuple[Optional[str], SectionType, int]:
+		"""Identity of this section on the page: (name, type, section_index)."""
+		return (self.name, self.type, self.section_index)
+
+	def find_question(self, question_text: str) -> Optional[QuestionWithAnswer]:
+		"""Look up a tracked question by its text."""
+		return self._questions_by_text.get(question_text)
+
+	def add_question(self, question: ApplicationQuestion) -> QuestionWithAnswer:
+		"""Add a question to this section and index it by text."""
+		question_with_answer = QuestionWithAnswer.from_question(question)
+		self.questions.append(question_with_answer)
+		self._questions_by_text[question_with_answer.question_text] = question_with_answer
+		return question_with_answer
+
+	def is_answered(self, question_text: str) -> bool:
+		"""Whether a tracked question in this section has an answer."""
+		return question_text in self.answers_by_text
+
+	def _set_answer(self, question: QuestionWithAnswer, answer: QuestionAnswer) -> None:
+		"""Attach an answer to a question of this section, keeping the answer lookups in sync.
+
+		Only PipelineState.set_question_answer calls this, so the pipeline's answered counter stays in sync too.
+		"""
+		question.answer = answer
+		self.answers_by_text[question.question_text] = answer
+		if answer.filled_successfully:
+			self.filled_question_texts.add(question.question_text)
+		else:
+			self.filled_question_texts.discard(question.question_text)
+
+
+@dataclass(slots=True)
 class PipelineState:
 	"""Tracks state throughout the job application pipeline.
 
@@ -101,39 +155,100 @@ class PipelineState:
 	failed_questions: Dict[str, int] = field(default_factory=dict)  # question_text -> retry_count
 	validation_errors: List[str] = field(default_factory=list)
 
+	# Recent page classification / section identification completions for this pipeline (see cached_ainvoke)
+	llm_cache: LLMResponseCache = field(default_factory=LLMResponseCache, repr=False, compare=False)
+
+	# Index of sections by (name, type, section_index) (kept in sync by add_section)
+	_sections_by_key: Dict[Tuple[Optional[str], SectionType, int], SectionWithQuestions] = field(
+		default_factory=dict, init=False, repr=False, compare=False
+	)
+	# First section with each display name, for the name-based methods (kept in sync by add_section)
+	_sections_by_name: Dict[str, SectionWithQuestions] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+	# Running progress counters (kept in sync by set_question_answer and complete_section)
+	_answered_count: int = field(default=0, init=False, repr=False, compare=False)
+	_completed_sections_count: int = field(default=0, init=False, repr=False, compare=False)
+
+	def __post_init__(self) -> None:
+		self._sections_by_key = {section.key: section for section in self.sections}
+		self._sections_by_name = {}
+		for section in self.sections:
+			self._sections_by_name.setdefault(section.display_name, section)
+		self._answered_count = sum(len(section.answers_by_text) for section in self.sections)
+		self._completed_sections_count = sum(1 for section in self.sections if section.is_complete)
+
+	@property
+	def answered_count(self) -> int:
+		"""Number of tracked questions that have an answer."""
+		return self._answered_count
+
+	@property
+	def completed_sections_count(self) -> int:
+		"""Number of tracked sections marked complete."""
+		return self._completed_sections_count
+
 	def add_section(self, section: ApplicationSection) -> SectionWithQuestions:
 		"""Add new section to tracking."""
 		section_with_questions = SectionWithQuestions.from_section(section)
 		self.sections.append(section_with_questions)
+		self._sections_by_key[section_with_questions.key] = section_with_questions
+		self._sections_by_name.setdefault(section_with_questions.display_name, section_with_questions)
 		return section_with_questions
 
+	def find_section(self, section: ApplicationSection) -> Optional[SectionWithQuestions]:
+		"""Look up a tracked section matching the given section's name, type and index."""
+		return self._sections_by_key.get((section.name, section.section_type, section.section_index))
+
+	def set_question_answer(
+		self, section: SectionWithQuestions, question: QuestionWithAnswer, answer: QuestionAnswer
+	) -> None:
+		"""Attach an answer to a tracked question of a section, keeping the answered counter in sync."""
+		if not section.is_answered(question.question_text):
+			self._answered_count += 1
+		section._set_answer(question, answer)
+
+	def apply_fill_result(self, section: SectionWithQuestions, question: QuestionWithAnswer, answer: QuestionAnswer) -> int:
+		"""Record a fill attempt in one update: attach the answer and, if the fill failed, count the retry.
+
+		Returns:
+			The question's retry count after this attempt (0 when it was filled successfully)
+		"""
+		self.set_question_answer(section, question, answer)
+		if answer.filled_successfully:
+			return 0
+		return self.increment_failed_question(question.question_text)
+
+	def complete_section(self, section: SectionWithQuestions) -> None:
+		"""Mark a tracked section as complete, keeping the completed counter in sync."""
+		if not section.is_complete:
+			self._completed_sections_count += 1
+		section.is_complete = True
+
 	def add_question_to_section(self, section_name: str, question: ApplicationQuestion) -> None:
 		"""Add question to existing section."""
 		# Find section by name or type
-		for section in self.sections:
-			if section.name == section_name or (section.name is None and section.type.value == section_name):
-				section.questions.append(QuestionWithAnswer.from_question(question))
-				return
+		section = self._sections_by_name.get(section_name)
+		if section is not None:
+			section.add_question(question)
+			return
 		# If section not found, create it
 		# This shouldn't happen in normal flow, but handle gracefully
 		raise ValueError(f"Section '{section_name}' not found in pipeline state")
 
 	def update_question_answer(self, section_name: str, question_text: str, answer: QuestionAnswer) -> None:
 		"""Update answer for a question."""
-		for section in self.sections:
-			if section.name == section_name or (section.name is None and section.type.value == section_name):
-				for question in section.questions:
-					if question.question_text == question_text:
-						question.answer = answer
-						return
+		section = self._sections_by_name.get(section_name)
+		question = section.find_question(question_text) if section is not None else None
+		if question is not None:
+			self.set_question_answer(section, question, answer)
+			return
 		raise ValueError(f"Question '{question_text}' not found in section '{section_name}'")
 
 	def mark_section_complete(self, section_name: str) -> None:
 		"""Mark section as complete."""
-		for section in self.sections:
-			if section.name == section_name or (section.name is None and section.type.value == section_name):
-				section.is_complete = True
-				return
+		section = self._sections_by_name.get(section_name)
+		if section is not None:
+			self.complete_section(section)
 
 	def increment_failed_question(self, question_text: str) -> int:
 		"""Increment retry count for a failed question."""
@@ -142,18 +257,38 @@ class PipelineState:
 
 	def get_all_question_answers(self) -> List[QuestionAnswer]:
 		"""Flatten structure for LLM context or display."""
-		answers = []
-		for section in self.sections:
-			for question in section.questions:
-				if question.answer:
-					answers.append(question.answer)
-		return answers
+		return [question.answer for section in self.sections for question in section.questions if question.answer]
 
 	def get_completed_sections(self) -> List[str]:
 		"""Get list of completed section names/types."""
-		completed = []
-		for section in self.sections:
-			if section.is_complete:
-				completed.append(section.name or section.type.value)
-		return completed
+		return [section.display_name for section in self.sections if section.is_complete]
+
+	def to_serializable(self) -> List[Dict[str, Any]]:
+		"""Flatten sections, questions and answers into plain dicts for display or JSON.
+
+		Reads fields directly in one pass instead of recursively dumping the wrapper and model objects. Questions
+		that failed to fill also carry their error_message; successful ones omit it.
+		"""
+		return [
+			{
+				'name': section.display_name,
+				'type': section.type.value,
+				'is_complete': section.is_complete,
+				'questions': [self._serialize_question(question) for question in section.questions],
+			}
+			for section in self.sections
+		]
+
+	@staticmethod
+	def _serialize_question(question: QuestionWithAnswer) -> Dict[str, Any]:
+		"""Plain dict for one question, with error_message only on the error path."""
+		answer = question.answer
+		serialized: Dict[str, Any] = {
+			'question_text': question.question_text,
+			'answer_value': answer.answer_value if answer else None,
+			'filled_successfully': answer.filled_successfully if answer else False,
+		}
+		if answer and answer.error_message:
+			serialized['error_message'] = answer.error_message
+		return serialized
 
@@ -3,6 +3,8 @@
 This module re-exports schemas from shared and step directories for backwards compatibility.
 """
 
+from typing import TYPE_CHECKING
+
 # Re-export shared enums
 from browser_use.job_application.pipeline.shared.enums import PageType, QuestionType, SectionType
 
@@ -15,12 +17,43 @@ from browser_use.job_application.pipeline.shared.schemas import (
 	QuestionOption,
 )
 
-# Re-export step-specific schemas
-from browser_use.job_application.pipeline.answer_generation.schema import AnswerGenerationOutput
-from browser_use.job_application.pipeline.page_classification.schema import PageClassificationOutput
-from browser_use.job_application.pipeline.question_filling.schema import FillResult
-from browser_use.job_application.pipeline.navigation.schema import NavigationResult
-from browser_use.job_application.pipeline.section_identification.schema import SectionIdentificationOutput
+# Re-export step-specific schemas lazily: importing a step's schema imports the whole step package (its run module
+# and everything that pulls in), so it only happens on first access
+if TYPE_CHECKING:
+	from browser_use.job_application.pipeline.answer_generation.schema import AnswerGenerationOutput
+	from browser_use.job_application.pipeline.navigation.schema import NavigationResult
+	from browser_use.job_application.pipeline.page_classification.schema import PageClassificationOutput
+	from browser_use.job_application.pipeline.question_filling.schema import FillResult
+	from browser_use.job_application.pipeline.section_identification.schema import SectionIdentificationOutput
+
+_LAZY_IMPORTS = {
+	'AnswerGenerationOutput': ('browser_use.job_application.pipeline.answer_generation.schema', 'AnswerGenerationOutput'),
+	'PageClassificationOutput': ('browser_use.job_application.pipeline.page_classification.schema', 'PageClassificationOutput'),
+	'FillResult': ('browser_use.job_application.pipeline.question_filling.schema', 'FillResult'),
+	'NavigationResult': ('browser_use.job_application.pipeline.navigation.schema', 'NavigationResult'),
+	'SectionIdentificationOutput': (
+		'browser_use.job_application.pipeline.section_identification.schema',
+		'SectionIdentificationOutput',
+	),
+}
+
+
+def __getattr__(name: str):
+	"""Lazy import mechanism - only import step schemas when they're actually accessed."""
+	if name in _LAZY_IMPORTS:
+		module_path, attr_name = _LAZY_IMPORTS[name]
+		try:
+			from importlib import import_module
+
+			attr = getattr(import_module(module_path), attr_name)
+			# Cache the imported attribute in the module's globals
+			globals()[name] = attr
+			return attr
+		except ImportError as e:
+			raise ImportError(f'Failed to import {name} from {module_path}: {e}') from e
+
+	raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
 # Note: ApplicationQuestion and QuestionOption are re-exported from shared.schemas
 # They are also defined in question_extraction.schema but we use the shared versions for consistency
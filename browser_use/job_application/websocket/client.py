@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import os
-from typing import Optional
+from typing import Any, List, Optional
 
 from browser_use.job_application.pipeline.views import ApplicationQuestion, QuestionAnswer
 
@@ -22,38 +22,41 @@ class AnswerGeneratorClient:
 		self.websocket_url = websocket_url or os.getenv('ANSWER_GENERATOR_WEBSOCKET_URL')
 		self._websocket = None
 		self._connected = False
-		self._connecting = False
+		self._connect_lock = asyncio.Lock()
+
+	async def __aenter__(self) -> 'AnswerGeneratorClient':
+		await self.connect()
+		return self
+
+	async def __aexit__(self, *exc_info: Any) -> None:
+		await self.disconnect()
 
 	async def connect(self) -> None:
-		"""Establish websocket connection."""
-		if self._connected:
-			return
+		"""Establish websocket connection.
 
+		The connection is kept open until disconnect() so every generate_answer call reuses the same socket.
+		"""
 		if not self.websocket_url:
 			logger.warning('No websocket URL provided - answer generation will not be available')
 			return
 
-		if self._connecting:
-			# Wait for connection attempt to complete
-			while self._connecting:
-				await asyncio.sleep(0.1)
-			return
-
-		self._connecting = True
-		try:
-			# TODO: Implement actual websocket connection
-			# For now, this is a stub
-			logger.info(f'Connecting to answer generator websocket: {self.websocket_url}')
-			# Placeholder: would use websockets library or similar
-			# self._websocket = await websockets.connect(self.websocket_url)
-			self._connected = True
-			logger.info('Connected to answer generator websocket')
-		except Exception as e:
-			logger.error(f'Failed to connect to websocket: {e}')
-			self._connected = False
-			raise
-		finally:
-			self._connecting = False
+		# Concurrent callers wait for the attempt already in progress instead of opening a second socket
+		async with self._connect_lock:
+			if self._connected:
+				return
+
+			try:
+				# TODO: Implement actual websocket connection
+				# For now, this is a stub
+				logger.info(f'Connecting to answer generator websocket: {self.websocket_url}')
+				# Placeholder: would use websockets library or similar
+				# self._websocket = await websockets.connect(self.websocket_url)
+				self._connected = True
+				logger.info('Connected to answer generator websocket')
+			except Exception as e:
+				logger.error(f'Failed to connect to websocket: {e}')
+				self._connected = False
+				raise
 
 	async def disconnect(self) -> None:
 		"""Close websocket connection."""
@@ -71,8 +74,18 @@ class AnswerGeneratorClient:
 			self._connected = False
 			self._websocket = None
 
+	async def _ensure_available(self) -> None:
+		"""Connect if needed and raise NotImplementedError when answers cannot be generated over the socket."""
+		if not self._connected:
+			await self.connect()
+
+		if not self._connected or not self.websocket_url:
+			raise NotImplementedError(
+				'Websocket answer generation not available. Set ANSWER_GENERATOR_WEBSOCKET_URL environment variable.'
+			)
+
 	async def generate_answer(self, question: ApplicationQuestion) -> QuestionAnswer:
-		"""Generate answer for a question via websocket.
+		"""Generate answer for a question via websocket (a one-question batch, so there is one message format).
 
 		Args:
 			question: The question to generate an answer for
@@ -83,43 +96,59 @@ class AnswerGeneratorClient:
 		Raises:
 			NotImplementedError: If websocket is not connected or not implemented
 		"""
-		if not self._connected:
-			await self.connect()
+		answers = await self.generate_answers([question])
+		return answers[0]
 
-		if not self._connected or not self.websocket_url:
-			raise NotImplementedError(
-				'Websocket answer generation not available. Set ANSWER_GENERATOR_WEBSOCKET_URL environment variable.'
-			)
+	async def generate_answers(self, questions: List[ApplicationQuestion]) -> List[QuestionAnswer]:
+		"""Generate answers for several questions via websocket.
+
+		Args:
+			questions: The questions to generate answers for
+
+		Returns:
+			QuestionAnswers in the same order as the questions
+
+		Raises:
+			NotImplementedError: If websocket is not connected or not implemented
+		"""
+		if not questions:
+			return []
+
+		await self._ensure_available()
 
 		try:
-			# TODO: Implement actual websocket message sending/receiving
+			# TODO: Implement actual websocket message sending/receiving once the server contract exists
 			# For now, this is a stub that raises NotImplementedError
-			# Example implementation:
-			# message = {
-			#     'question_text': question.question_text,
-			#     'question_type': question.question_type.value,
-			#     'is_required': question.is_required,
-			#     'options': [opt.model_dump() for opt in question.options],
-			#     'section_type': question.section_type.value,
-			# }
+			# Example implementation (one frame for the whole batch, answers returned in question order):
+			# message = {'questions': [
+			#     {
+			#         'question_text': question.question_text,
+			#         'question_type': question.question_type.value,
+			#         'is_required': question.is_required,
+			#         'options': [opt.model_dump() for opt in question.options],
+			#         'section_type': question.section_type.value,
+			#     }
+			#     for question in questions
+			# ]}
 			# await self._websocket.send(json.dumps(message))
-			# response = await self._websocket.recv()
-			# answer_data = json.loads(response)
-			# return QuestionAnswer(
-			#     question_text=question.question_text,
-			#     answer_value=answer_data['answer'],
-			#     answer_type=question.question_type,
-			#     element_index=question.element_index,
-			#     filled_successfully=True,
-			# )
+			# answers_data = json.loads(await self._websocket.recv())['answers']
+			# return [
+			#     QuestionAnswer(
+			#         question_text=question.question_text,
+			#         answer_value=answer_data['answer'],
+			#         answer_type=question.question_type,
+			#         element_index=question.element_index,
+			#         filled_successfully=True,
+			#     )
+			#     for question, answer_data in zip(questions, answers_data)
+			# ]
 
 			raise NotImplementedError('Websocket answer generation not yet implemented')
 		except Exception as e:
-			logger.error(f'Failed to generate answer via websocket: {e}')
+			logger.error(f'Failed to generate answers via websocket: {e}')
 			raise
 
 	@property
 	def is_connected(self) -> bool:
 		"""Check if websocket is connected."""
 		return self._connected
-
@@ -34,29 +34,22 @@ async def test_playwright_timeout():
         await session.kill()
         return
     
-    # Log all available elements
-    logger.info(f"📋 Found {len(browser_state.dom_state.selector_map)} elements in selector_map:")
-    for idx, (backend_node_id, node) in enumerate(list(browser_state.dom_state.selector_map.items())[:10]):
-        logger.info(f"   [{idx+1}] backend_node_id={backend_node_id}, tag={node.node_name}, visible={node.is_visible}")
-    
-    # Try to find h1 first, then fall back to any element
-    test_node = None
-    for backend_node_id, node in browser_state.dom_state.selector_map.items():
-        if node.node_name.lower() == 'h1':
-            test_node = node
-            logger.info(f"✅ Found h1 element: backend_node_id={backend_node_id}")
-            break
-    
-    # If no h1, use the first available element
-    if not test_node:
-        first_backend_id = next(iter(browser_state.dom_state.selector_map.keys()))
-        test_node = browser_state.dom_state.selector_map[first_backend_id]
-        logger.info(f"⚠️ No h1 found, using first element: backend_node_id={first_backend_id}, tag={test_node.node_name}")
-    
-    if not test_node:
-        logger.error("❌ No elements found in selector_map!")
-        await session.kill()
-        return
+    # One pass over the selector_map: log the first elements and index the first node per tag
+    selector_map = browser_state.dom_state.selector_map
+    logger.info(f"📋 Found {len(selector_map)} elements in selector_map:")
+    tag_to_node = {}
+    for idx, (backend_node_id, node) in enumerate(selector_map.items()):
+        if idx < 10:
+            logger.info(f"   [{idx+1}] backend_node_id={backend_node_id}, tag={node.node_name}, visible={node.is_visible}")
+        tag_to_node.setdefault(node.node_name.lower(), node)
+    
+    # Try to find h1 first, then fall back to the first available element
+    test_node = tag_to_node.get('h1')
+    if test_node:
+        logger.info(f"✅ Found h1 element: backend_node_id={test_node.backend_node_id}")
+    else:
+        test_node = next(iter(selector_map.values()))
+        logger.info(f"⚠️ No h1 found, using first element: backend_node_id={test_node.backend_node_id}, tag={test_node.node_name}")
     
     # Test 1: Direct Playwright call (like before - should work)
     logger.info("\n📄 Test 1: Direct Playwright call (baseline)...")
@@ -68,12 +61,8 @@ async def test_playwright_timeout():
     
     try:
         page = await playwright_watchdog._get_playwright_page()
-        # Try to find h1, or use body if h1 not available
-        try:
-            locator = page.locator("h1").first
-            await locator.wait_for(state='visible', timeout=2000)
-        except:
-            locator = page.locator("body").first
+        # The DOM scan above already knows whether there is an h1, so don't probe for one with a timeout
+        locator = page.locator("h1" if 'h1' in tag_to_node else "body").first
         await locator.scroll_into_view_if_needed()
         await locator.wait_for(state='visible', timeout=5000)
         box = await locator.bounding_box()
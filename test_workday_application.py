@@ -8,11 +8,12 @@ Make sure you have OpenAI env vars set:
     OPENAI_API_KEY (required)
     OPENAI_MODEL (optional, defaults to gpt-4o-mini)
     RESUME_API_KEY (optional, for downloading resume from API)
+    AGENT_FLASH_MODE (optional, set to 1 to have the LLM emit only memory + actions per step)
 """
 import asyncio
 import os
 import sys
-import json
+import time
 from pathlib import Path
 
 # Add browser-use to path
@@ -29,6 +30,12 @@ from browser_use.browser import BrowserSession
 from pydantic import BaseModel, Field
 import httpx
 
+try:
+    # Faster parsing of the nested user profile when available; same dicts/lists as the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 # User data - will be loaded from JSON file or set here
 USER_DATA = None  # Will be set from JSON file or you can paste it here
@@ -69,14 +76,67 @@ class FindPasswordResetLinkParams(BaseModel):
     workday_app_url: str = Field(description="The Workday application URL to match against")
 
 
+class PollProxyEmailParams(BaseModel):
+    proxy_email: str = Field(description="The proxy email address to check")
+    btn_click_time: str = Field(description="Timestamp when the button was clicked (ISO format or Unix timestamp)")
+    company_name: str = Field(description="Name of the company (for Workday, can be extracted from URL)")
+    workday_app_url: str = Field(description="The Workday application URL to match against")
+    ats: str = Field(default="workday", description="ATS type, typically 'workday' for Workday applications")
+
+
+# Backoff between polls of the email proxy while waiting for an email to arrive
+PROXY_POLL_DELAYS = (1.0, 2.0, 4.0)
+
+# Per-attempt timeouts for the resume and email proxy requests: a short first attempt so a stalled
+# connection is retried quickly instead of holding the agent for the full timeout
+HTTP_ATTEMPT_TIMEOUTS = (5.0, 10.0, 20.0)
+
+# Proxy responses that found something, by (endpoint, payload), so re-polls within the TTL skip the POST
+PROXY_RESULT_TTL = 60.0
+_proxy_result_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+# (output key, section, source key, default factory) for the fields copied straight out of a section of the user data
+_FLAT_FIELDS = (
+    ('email', 'identity', 'EMAIL', str),
+    ('phone', 'identity', 'PHONE_NUMBER', str),
+    ('city', 'location', 'USER_LOCATION_CITY', str),
+    ('state', 'location', 'USER_LOCATION_STATE', str),
+    ('zip', 'location', 'USER_LOCATION_ZIP_CODE', str),
+    ('country', 'location', 'USER_LOCATION_COUNTRY', str),
+    ('address', 'location', 'USER_LOCATION_STREET_ADDRESS', str),
+    ('date_of_birth', 'identity', 'DATE_OF_BIRTH', dict),
+    ('gender', 'demographics', 'GENDER', str),
+    ('age_bracket', 'demographics', 'AGE_BRACKET', str),
+    ('veteran', 'demographics', 'VETERAN', str),
+    ('disability', 'demographics', 'DISABILITY', str),
+    ('races', 'demographics', 'RACES', dict),
+    ('work_experiences', 'resume', 'WORK_EXPERIENCES', list),
+    ('educations', 'resume', 'EDUCATIONS', list),
+    ('skills', 'resume', 'SKILLS', list),
+    ('linkedin', 'resume', 'LINKEDIN_URL', str),
+    ('github', 'resume', 'GITHUB_URL', str),
+    ('portfolio', 'resume', 'PORTFOLIO_URL', str),
+    ('work_authorizations', 'professional', 'workAuthorizations', list),
+    ('resume_file', 'resume_document', 'name', str),
+    ('resume_id', 'resume_document', 'id', str),
+)
+
+
 def extract_user_info(user_data: dict) -> dict:
     """Extract user information from nested structure"""
     user = user_data.get('user', {})
     personal = user.get('personal', {})
     identity = personal.get('identity', {})
-    demographics = personal.get('demographics', {})
     professional = user.get('professional', {})
-    resume = professional.get('resume', {})
+    sections = {
+        'identity': identity,
+        'location': identity.get('USER_LOCATION', {}),
+        'demographics': personal.get('demographics', {}),
+        'professional': professional,
+        'resume': professional.get('resume', {}),
+        'resume_document': user_data.get('documents', {}).get('primary', {}).get('RESUME', {}),
+    }
     
     # Extract name
     first_name = identity.get('FIRST_NAME', '')
@@ -84,58 +144,31 @@ def extract_user_info(user_data: dict) -> dict:
     middle_name = identity.get('MIDDLE_NAME', '')
     preferred_name = identity.get('PREFERRED_NAME', '')
     full_name = f"{first_name} {middle_name} {last_name}".strip() if middle_name else f"{first_name} {last_name}".strip()
-    display_name = preferred_name or full_name
-    
-    # Extract location
-    location = identity.get('USER_LOCATION', {})
-    
-    # Extract work experience
-    work_experiences = resume.get('WORK_EXPERIENCES', [])
     
-    # Extract education
-    educations = resume.get('EDUCATIONS', [])
-    
-    # Extract skills
-    skills = resume.get('SKILLS', [])
-    
-    return {
+    info = {
         'first_name': first_name,
         'last_name': last_name,
         'middle_name': middle_name,
         'preferred_name': preferred_name,
         'full_name': full_name,
-        'display_name': display_name,
-        'email': identity.get('EMAIL', ''),
-        'phone': identity.get('PHONE_NUMBER', ''),
-        'city': location.get('USER_LOCATION_CITY', ''),
-        'state': location.get('USER_LOCATION_STATE', ''),
-        'zip': location.get('USER_LOCATION_ZIP_CODE', ''),
-        'country': location.get('USER_LOCATION_COUNTRY', ''),
-        'address': location.get('USER_LOCATION_STREET_ADDRESS', ''),
-        'date_of_birth': identity.get('DATE_OF_BIRTH', {}),
-        'gender': demographics.get('GENDER', ''),
-        'age_bracket': demographics.get('AGE_BRACKET', ''),
-        'veteran': demographics.get('VETERAN', ''),
-        'disability': demographics.get('DISABILITY', ''),
-        'races': demographics.get('RACES', {}),
-        'work_experiences': work_experiences,
-        'educations': educations,
-        'skills': skills,
-        'linkedin': resume.get('LINKEDIN_URL', ''),
-        'github': resume.get('GITHUB_URL', ''),
-        'portfolio': resume.get('PORTFOLIO_URL', ''),
-        'work_authorizations': professional.get('workAuthorizations', []),
-        'resume_file': user_data.get('documents', {}).get('primary', {}).get('RESUME', {}).get('name', ''),
-        'resume_id': user_data.get('documents', {}).get('primary', {}).get('RESUME', {}).get('id', ''),
+        'display_name': preferred_name or full_name,
     }
+    
+    # Copy the flat fields in one pass over the field table
+    for key, section, source_key, default in _FLAT_FIELDS:
+        fields = sections[section]
+        info[key] = fields[source_key] if source_key in fields else default()
+    
+    return info
 
 
-def build_task_from_user_data(user_data: dict) -> str:
-    """Build a task description with only user information (no workflow instructions)"""
+def build_task_from_user_info(info: dict) -> str:
+    """Build a task description with only user information (no workflow instructions)
     
-    info = extract_user_info(user_data)
+    Takes the flat dict from extract_user_info, so callers extract it once and reuse it.
+    """
     
-    task = f"""Job Application URL: {JOB_URL}
+    parts = [f"""Job Application URL: {JOB_URL}
 
 User Information:
 
@@ -152,34 +185,34 @@ Personal Information:
 
 password to use: ObaMa!2025
 account exists: True
-"""
+"""]
     
     if info['address']:
-        task += f"- Street Address: {info['address']}\n"
+        parts.append(f"- Street Address: {info['address']}\n")
     
     # Date of birth
     dob = info['date_of_birth']
     if dob.get('day') and dob.get('month') and dob.get('year'):
-        task += f"- Date of Birth: {dob['month']}/{dob['day']}/{dob['year']}\n"
+        parts.append(f"- Date of Birth: {dob['month']}/{dob['day']}/{dob['year']}\n")
     
     # Demographics
-    task += f"\nDemographics:\n"
-    task += f"- Gender: {info['gender']}\n"
+    parts.append("\nDemographics:\n")
+    parts.append(f"- Gender: {info['gender']}\n")
     if info['age_bracket']:
-        task += f"- Age Bracket: {info['age_bracket']}\n"
-    task += f"- Veteran Status: {info['veteran']}\n"
-    task += f"- Disability Status: {info['disability']}\n"
+        parts.append(f"- Age Bracket: {info['age_bracket']}\n")
+    parts.append(f"- Veteran Status: {info['veteran']}\n")
+    parts.append(f"- Disability Status: {info['disability']}\n")
     
     # Race/Ethnicity
     races = info['races']
     if races:
         selected_races = [k for k, v in races.items() if v]
         if selected_races:
-            task += f"- Race/Ethnicity: {', '.join(selected_races)}\n"
+            parts.append(f"- Race/Ethnicity: {', '.join(selected_races)}\n")
     
     # Work Experience
     if info['work_experiences']:
-        task += "\nWork Experience:\n"
+        parts.append("\nWork Experience:\n")
         for idx, exp in enumerate(info['work_experiences'][:5], 1):
             title = exp.get('TITLE', '')
             company = exp.get('COMPANY', '')
@@ -191,22 +224,19 @@ account exists: True
             start_str = f"{start.get('month', '')}/{start.get('year', '')}" if start.get('month') else ""
             end_str = "Present" if currently_employed else (f"{end.get('month', '')}/{end.get('year', '')}" if end.get('month') else "")
             
-            task += f"{idx}. {title} at {company}"
+            parts.append(f"{idx}. {title} at {company}")
             if location:
-                task += f" ({location})"
+                parts.append(f" ({location})")
             if start_str:
-                task += f" - {start_str} to {end_str}"
-            task += "\n"
+                parts.append(f" - {start_str} to {end_str}")
+            parts.append("\n")
             
-            # Add responsibilities
-            responsibilities = exp.get('RESPONSIBILITIES', [])
-            if responsibilities:
-                for resp in responsibilities[:2]:  # Limit to 2 per job
-                    task += f"   • {resp}\n"
+            # Add responsibilities (limit to 2 per job)
+            parts.extend(f"   • {resp}\n" for resp in exp.get('RESPONSIBILITIES', [])[:2])
     
     # Education
     if info['educations']:
-        task += "\nEducation:\n"
+        parts.append("\nEducation:\n")
         for edu in info['educations'][:3]:
             institution = edu.get('INSTITUTION', '')
             degree = edu.get('DEGREE', '').replace('_', ' ').title()
@@ -214,62 +244,65 @@ account exists: True
             completion = edu.get('COMPLETION_DATE', {})
             location = edu.get('LOCATION', '')
             
-            task += f"- {degree}"
+            parts.append(f"- {degree}")
             if majors:
-                task += f" in {', '.join(majors)}"
-            task += f" from {institution}"
+                parts.append(f" in {', '.join(majors)}")
+            parts.append(f" from {institution}")
             if location:
-                task += f" ({location})"
+                parts.append(f" ({location})")
             if completion.get('year'):
-                task += f" - Graduated {completion['year']}"
-            task += "\n"
+                parts.append(f" - Graduated {completion['year']}")
+            parts.append("\n")
     
     # Skills
     if info['skills']:
         skills_str = ', '.join(info['skills'][:15])
-        task += f"\nSkills: {skills_str}\n"
+        parts.append(f"\nSkills: {skills_str}\n")
     
     # Links
     if info['linkedin']:
-        task += f"- LinkedIn: {info['linkedin']}\n"
+        parts.append(f"- LinkedIn: {info['linkedin']}\n")
     if info['github']:
-        task += f"- GitHub: {info['github']}\n"
+        parts.append(f"- GitHub: {info['github']}\n")
     if info['portfolio']:
-        task += f"- Portfolio: {info['portfolio']}\n"
+        parts.append(f"- Portfolio: {info['portfolio']}\n")
     
     # Work Authorization
     work_auths = info['work_authorizations']
     us_auth = None
     if work_auths:
-        task += "\nWork Authorization:\n"
+        parts.append("\nWork Authorization:\n")
         for auth in work_auths:
             country = auth.get('COUNTRY', '')
             status = auth.get('STATUS', {})
             if country == 'United States':
                 us_auth = status
             if status.get('CITIZEN'):
-                task += f"- Citizen of {country}\n"
+                parts.append(f"- Citizen of {country}\n")
             elif status.get('AUTHORIZED_WORKER'):
-                task += f"- Authorized to work in {country}\n"
+                parts.append(f"- Authorized to work in {country}\n")
             if status.get('NEEDS_EMPLOYER_SPONSORSHIP'):
-                task += f"- Needs sponsorship: Yes\n"
+                parts.append("- Needs sponsorship: Yes\n")
             else:
-                task += f"- Needs sponsorship: No\n"
+                parts.append("- Needs sponsorship: No\n")
     
     # Special notes specific to this user's data
-    task += "\nSpecial Notes:\n"
-    task += "- For \"Currently Employed\" questions, mark the Operations Manager position as current (Present)\n"
-    task += "- For previous employment, mark Business Analyst as ended in 02/2021\n"
+    parts.append("\nSpecial Notes:\n")
+    parts.append("- For \"Currently Employed\" questions, mark the Operations Manager position as current (Present)\n")
+    parts.append("- For previous employment, mark Business Analyst as ended in 02/2021\n")
     
-    return task
+    return "".join(parts)
 
 
-async def main(user_data: dict):
+async def main(info: dict, task: str):
+    """Run the agent for one application.
+    
+    Takes the user info from extract_user_info and the task built from it, both prepared before the event loop starts.
+    """
     print("🤖 Starting browser-use agent for Workday job application...")
     print(f"📍 Job URL: {JOB_URL}")
     
-    # Extract user name for display
-    info = extract_user_info(user_data)
+    # User name for display
     print(f"👤 User: {info['full_name']} ({info['email']})")
     print()
     
@@ -285,193 +318,305 @@ async def main(user_data: dict):
         api_key=os.getenv('OPENAI_API_KEY'),
     )
     
-    # Initialize tools and add custom resume download tool
-    tools = Tools()
-    resume_id = info.get('resume_id', '793667')
-    resume_filename = info.get('resume_file', 'Obama_Osama_resume.pdf')
-    
-    @tools.action('Download resume file from the API endpoint. Use this when you need to upload the resume.')
-    async def download_resume(browser_session: BrowserSession):
-        """Download resume from API endpoint"""
-        resume_url = f"{RESUME_ENDPOINT_BASE}/{resume_id}"
+    # One pooled HTTP client shared by the custom tools, so repeated calls (e.g. polling for
+    # security codes) reuse kept-alive connections instead of reconnecting every time. It is opened
+    # before anything uses it (the resume pre-download runs before the agent) and closed however the run ends
+    async with httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=10)) as http_client:
+        # Initialize tools and add custom resume download tool
+        tools = Tools()
+        resume_id = info.get('resume_id', '793667')
+        resume_filename = info.get('resume_file', 'Obama_Osama_resume.pdf')
+    
+        async def fetch_resume() -> Path:
+            """Download the resume to disk (or reuse a previous download) and return its path"""
+            # Save to a temporary location, one directory per resume_id so the uploaded file keeps its name
+            temp_dir = Path('/tmp') / 'resumes' / str(resume_id)
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            file_path = temp_dir / resume_filename
+        
+            # The resume for a given id doesn't change, so reuse a previous complete download
+            if file_path.exists() and file_path.stat().st_size > 0:
+                return file_path
+        
+            resume_url = f"{RESUME_ENDPOINT_BASE}/{resume_id}"
+        
+            # Get API key from environment if available
+            api_key = os.getenv('RESUME_API_KEY')
+            print(f"🔍 Debug - Resume API Key: {api_key}")
+            headers = {}
+            if api_key:
+                headers['X-Api-Key'] = api_key
         
-        # Get API key from environment if available
-        api_key = os.getenv('RESUME_API_KEY')
-        print(f"🔍 Debug - Resume API Key: {api_key}")
-        headers = {}
-        if api_key:
-            headers['X-Api-Key'] = api_key
+            partial_path = file_path.with_name(file_path.name + '.part')
         
-        try:
-            # Download the file
-            async with httpx.AsyncClient() as client:
-                response = await client.get(resume_url, headers=headers)
-                response.raise_for_status()
-                
-                # Save to a temporary location
-                temp_dir = Path('/tmp')
-                temp_dir.mkdir(exist_ok=True)
-                file_path = temp_dir / resume_filename
-                
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
-                
+            # Stream the file to disk in chunks rather than buffering the whole PDF in memory;
+            # it only replaces file_path once fully written
+            for attempt, timeout in enumerate(HTTP_ATTEMPT_TIMEOUTS, 1):
+                try:
+                    async with http_client.stream('GET', resume_url, headers=headers, timeout=timeout) as response:
+                        response.raise_for_status()
+                        with open(partial_path, 'wb') as f:
+                            async for chunk in response.aiter_bytes(chunk_size=65536):
+                                f.write(chunk)
+                    break
+                except httpx.TransportError as e:
+                    if attempt == len(HTTP_ATTEMPT_TIMEOUTS):
+                        raise
+                    print(f"⚠️  Resume download attempt {attempt} failed ({e!r}), retrying")
+            partial_path.replace(file_path)
+            return file_path
+    
+        @tools.action('Download resume file from the API endpoint. Use this when you need to upload the resume.')
+        async def download_resume(browser_session: BrowserSession):
+            """Download resume from API endpoint (usually already pre-downloaded at startup)"""
+            try:
+                file_path = await fetch_resume()
+            
                 # Add to browser session's downloaded files
                 browser_session.downloaded_files.append(str(file_path))
-                
+            
                 return ActionResult(
                     extracted_content=f"Resume downloaded successfully to {file_path}. Use upload_file action with path: {file_path}",
                     include_in_memory=True
                 )
-        except Exception as e:
-            return ActionResult(error=f"Failed to download resume: {str(e)}")
-    
-    @tools.action(
-        'Get security codes from email for Workday verification. Use this when Workday asks for a security code sent to your email.',
-        param_model=GetSecurityCodesParams,
-    )
-    async def get_security_codes(params: GetSecurityCodesParams):
-        """Get security codes from email proxy service"""
-        try:
-            url = f"{PROXY_EMAIL_SERVICE_URL}/find_security_codes"
-            payload = {
-                "ats_type": params.ats,
-                "company_name": params.company_name,
-                "proxy_email": params.proxy_email,
-                "search_start_time": params.btn_click_time
-            }
+            except Exception as e:
+                return ActionResult(error=f"Failed to download resume: {str(e)}")
+    
+        async def query_proxy(endpoint: str, payload: dict) -> dict:
+            """POST to an email proxy endpoint, reusing a recent response that already found codes or links"""
+            key = (endpoint, tuple(sorted(payload.items())))
+            cached = _proxy_result_cache.get(key)
+            if cached and time.monotonic() - cached[0] < PROXY_RESULT_TTL:
+                return cached[1]
+        
+            for attempt, timeout in enumerate(HTTP_ATTEMPT_TIMEOUTS, 1):
+                try:
+                    response = await http_client.post(
+                        f"{PROXY_EMAIL_SERVICE_URL}/{endpoint}", json=payload, headers=PROXY_SERVICE_HEADERS, timeout=timeout
+                    )
+                    break
+                except httpx.TransportError as e:
+                    # Timeouts and connection errors only; HTTP error statuses are raised below without retrying
+                    if attempt == len(HTTP_ATTEMPT_TIMEOUTS):
+                        raise
+                    print(f"⚠️  Email proxy {endpoint} attempt {attempt} failed ({e!r}), retrying")
+            response.raise_for_status()
+            result = response.json()
+            # "Nothing yet" responses aren't cached so the next poll still asks the service
+            if not result.get('error') and (result.get('security_codes') or result.get('links')):
+                _proxy_result_cache[key] = (time.monotonic(), result)
+            return result
+    
+        @tools.action(
+            'Get security codes from email for Workday verification. Use this when Workday asks for a security code sent to your email.',
+            param_model=GetSecurityCodesParams,
+        )
+        async def get_security_codes(params: GetSecurityCodesParams):
+            """Get security codes from email proxy service"""
+            try:
+                payload = {
+                    "ats_type": params.ats,
+                    "company_name": params.company_name,
+                    "proxy_email": params.proxy_email,
+                    "search_start_time": params.btn_click_time
+                }
+            
+                result = await query_proxy("find_security_codes", payload)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=PROXY_SERVICE_HEADERS, timeout=30.0)
-                response.raise_for_status()
-                result = response.json()
+                if result.get('error'):
+                    return ActionResult(error=f"Failed to get security codes: {result.get('error')}")
             
-            if result.get('error'):
-                return ActionResult(error=f"Failed to get security codes: {result.get('error')}")
+                security_codes = result.get('security_codes', [])
+                if not security_codes:
+                    return ActionResult(
+                        extracted_content="No security codes found in email yet. Wait a moment and try again.",
+                        long_term_memory="Attempted to get security codes but none found"
+                    )
             
-            security_codes = result.get('security_codes', [])
-            if not security_codes:
+                codes_str = ", ".join(security_codes)
                 return ActionResult(
-                    extracted_content="No security codes found in email yet. Wait a moment and try again.",
-                    long_term_memory="Attempted to get security codes but none found"
+                    extracted_content=f"Found security codes: {codes_str}. Use the most recent code.",
+                    long_term_memory=f"Retrieved security codes: {codes_str}"
                 )
+            except Exception as e:
+                return ActionResult(error=f"Failed to get security codes: {str(e)}")
+    
+        @tools.action(
+            'Find Workday confirmation link from email. Use this when Workday sends a confirmation email that needs to be clicked.',
+            param_model=FindConfirmationLinkParams,
+        )
+        async def find_confirmation_link(params: FindConfirmationLinkParams):
+            """Find Workday confirmation link from email"""
+            try:
+                payload = {
+                    "proxy_email": params.proxy_email,
+                    "search_start_time": params.btn_click_time,
+                    "workday_app_url": params.workday_app_url
+                }
             
-            codes_str = ", ".join(security_codes)
-            return ActionResult(
-                extracted_content=f"Found security codes: {codes_str}. Use the most recent code.",
-                long_term_memory=f"Retrieved security codes: {codes_str}"
-            )
-        except Exception as e:
-            return ActionResult(error=f"Failed to get security codes: {str(e)}")
-    
-    @tools.action(
-        'Find Workday confirmation link from email. Use this when Workday sends a confirmation email that needs to be clicked.',
-        param_model=FindConfirmationLinkParams,
-    )
-    async def find_confirmation_link(params: FindConfirmationLinkParams):
-        """Find Workday confirmation link from email"""
-        try:
-            url = f"{PROXY_EMAIL_SERVICE_URL}/find_workday_confirmation_link"
-            payload = {
-                "proxy_email": params.proxy_email,
-                "search_start_time": params.btn_click_time,
-                "workday_app_url": params.workday_app_url
-            }
+                result = await query_proxy("find_workday_confirmation_link", payload)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=PROXY_SERVICE_HEADERS, timeout=30.0)
-                response.raise_for_status()
-                result = response.json()
+                if result.get('error'):
+                    return ActionResult(error=f"Failed to find confirmation link: {result.get('error')}")
             
-            if result.get('error'):
-                return ActionResult(error=f"Failed to find confirmation link: {result.get('error')}")
+                links = result.get('links', [])
+                if not links:
+                    return ActionResult(
+                        extracted_content="No confirmation link found in email yet. Wait a moment and try again.",
+                        long_term_memory="Attempted to find confirmation link but none found"
+                    )
             
-            links = result.get('links', [])
-            if not links:
+                # Return the first/most recent link
+                confirmation_link = links[0] if isinstance(links, list) else links
                 return ActionResult(
-                    extracted_content="No confirmation link found in email yet. Wait a moment and try again.",
-                    long_term_memory="Attempted to find confirmation link but none found"
+                    extracted_content=f"Found confirmation link: {confirmation_link}. Use navigate action to open this URL.",
+                    long_term_memory=f"Found Workday confirmation link: {confirmation_link}"
                 )
+            except Exception as e:
+                return ActionResult(error=f"Failed to find confirmation link: {str(e)}")
+    
+        @tools.action(
+            'Find Workday password reset link from email. Use this when Workday sends a password reset email that needs to be clicked.',
+            param_model=FindPasswordResetLinkParams,
+        )
+        async def find_password_reset_link(params: FindPasswordResetLinkParams):
+            """Find Workday password reset link from email"""
+            try:
+                payload = {
+                    "proxy_email": params.proxy_email,
+                    "search_start_time": params.btn_click_time,
+                    "workday_app_url": params.workday_app_url
+                }
             
-            # Return the first/most recent link
-            confirmation_link = links[0] if isinstance(links, list) else links
-            return ActionResult(
-                extracted_content=f"Found confirmation link: {confirmation_link}. Use navigate action to open this URL.",
-                long_term_memory=f"Found Workday confirmation link: {confirmation_link}"
-            )
-        except Exception as e:
-            return ActionResult(error=f"Failed to find confirmation link: {str(e)}")
-    
-    @tools.action(
-        'Find Workday password reset link from email. Use this when Workday sends a password reset email that needs to be clicked.',
-        param_model=FindPasswordResetLinkParams,
-    )
-    async def find_password_reset_link(params: FindPasswordResetLinkParams):
-        """Find Workday password reset link from email"""
-        try:
-            url = f"{PROXY_EMAIL_SERVICE_URL}/find_workday_reset_password_link"
-            payload = {
-                "proxy_email": params.proxy_email,
-                "search_start_time": params.btn_click_time,
-                "workday_app_url": params.workday_app_url
-            }
+                result = await query_proxy("find_workday_reset_password_link", payload)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=PROXY_SERVICE_HEADERS, timeout=30.0)
-                response.raise_for_status()
-                result = response.json()
+                if result.get('error'):
+                    return ActionResult(error=f"Failed to find password reset link: {result.get('error')}")
             
-            if result.get('error'):
-                return ActionResult(error=f"Failed to find password reset link: {result.get('error')}")
+                links = result.get('links', [])
+                if not links:
+                    return ActionResult(
+                        extracted_content="No password reset link found in email yet. Wait a moment and try again.",
+                        long_term_memory="Attempted to find password reset link but none found"
+                    )
             
-            links = result.get('links', [])
-            if not links:
+                # Return the first/most recent link
+                reset_link = links[0] if isinstance(links, list) else links
                 return ActionResult(
-                    extracted_content="No password reset link found in email yet. Wait a moment and try again.",
-                    long_term_memory="Attempted to find password reset link but none found"
+                    extracted_content=f"Found password reset link: {reset_link}. Use navigate action to open this URL.",
+                    long_term_memory=f"Found Workday password reset link: {reset_link}"
+                )
+            except Exception as e:
+                return ActionResult(error=f"Failed to find password reset link: {str(e)}")
+    
+        @tools.action(
+            'Check the proxy email for a security code, confirmation link, or password reset link all at once, '
+            'waiting briefly for the email to arrive. Use this instead of calling the individual email tools one by one.',
+            param_model=PollProxyEmailParams,
+        )
+        async def poll_proxy_email(params: PollProxyEmailParams):
+            """Query all three email proxy endpoints concurrently, re-polling with backoff until something is found
+
+            Only endpoints that answered "nothing found yet" are polled again. An endpoint that failed (after
+            query_proxy's own transport retries) or returned an error is not retried, so an unreachable proxy
+            costs one round rather than one per poll.
+            """
+            link_payload = {
+                "proxy_email": params.proxy_email,
+                "search_start_time": params.btn_click_time,
+                "workday_app_url": params.workday_app_url
+            }
+            pending = [
+                ("security codes", "find_security_codes", {
+                    "ats_type": params.ats,
+                    "company_name": params.company_name,
+                    "proxy_email": params.proxy_email,
+                    "search_start_time": params.btn_click_time
+                }),
+                ("confirmation link", "find_workday_confirmation_link", link_payload),
+                ("password reset link", "find_workday_reset_password_link", link_payload),
+            ]
+        
+            errors = []
+            for attempt, delay in enumerate((0.0, *PROXY_POLL_DELAYS)):
+                if delay:
+                    await asyncio.sleep(delay)
+                results = await asyncio.gather(
+                    *(query_proxy(endpoint, payload) for _, endpoint, payload in pending), return_exceptions=True
                 )
             
-            # Return the first/most recent link
-            reset_link = links[0] if isinstance(links, list) else links
+                found = []
+                still_pending = []
+                for query, result in zip(pending, results):
+                    name = query[0]
+                    if isinstance(result, BaseException):
+                        errors.append(f"{name}: {result}")
+                    elif result.get('error'):
+                        errors.append(f"{name}: {result.get('error')}")
+                    elif result.get('security_codes'):
+                        found.append(f"{name}: {', '.join(result['security_codes'])} (use the most recent code)")
+                    elif result.get('links'):
+                        links = result['links']
+                        found.append(f"{name}: {links[0] if isinstance(links, list) else links} (use navigate action to open it)")
+                    else:
+                        still_pending.append(query)
+            
+                if found:
+                    summary = "; ".join(found)
+                    return ActionResult(
+                        extracted_content=f"Found {summary}",
+                        long_term_memory=f"Polled proxy email and found {summary}"
+                    )
+                pending = still_pending
+                if not pending:
+                    break
+                print(f"📭 Proxy email poll {attempt + 1}: nothing found yet")
+        
+            if errors:
+                return ActionResult(error=f"Failed to poll proxy email: {'; '.join(errors)}")
             return ActionResult(
-                extracted_content=f"Found password reset link: {reset_link}. Use navigate action to open this URL.",
-                long_term_memory=f"Found Workday password reset link: {reset_link}"
+                extracted_content="No security code, confirmation link, or password reset link found in email yet. Wait a moment and try again.",
+                long_term_memory="Polled proxy email but nothing found"
             )
-        except Exception as e:
-            return ActionResult(error=f"Failed to find password reset link: {str(e)}")
     
-    # Build task from user data
-    task = build_task_from_user_data(user_data)
+        # Extract email and password for account creation
+        # Email is already extracted in info
+        user_email = info.get('email', '')
+        # Password is currently hardcoded in build_task_from_user_info
+        # TODO: Extract password from user_data if it becomes available
+        user_password = "ObaMa!2025"
     
-    # Extract email and password for account creation
-    # Email is already extracted in info
-    user_email = info.get('email', '')
-    # Password is currently hardcoded in build_task_from_user_data
-    # TODO: Extract password from user_data if it becomes available
-    user_password = "ObaMa!2025"
-    
-    print("📋 Task:")
-    print(task)
-    print()
-    
-    # Create browser instance
-    browser = Browser()
-    
-    # Create agent (system prompt is now self-contained in system_prompt.md)
-    agent = Agent(
-        task=task,
-        llm=llm,
-        browser=browser,
-        tools=tools,
-        max_steps=50,  # Allow more steps for complex forms
-        email=user_email,
-        password=user_password,
-        user_profile=info,  # Pass extracted user profile data
-    )
+        print("📋 Task:")
+        print(task)
+        print()
     
-    # Run agent
-    print("🚀 Running agent...")
-    history = await agent.run()
+        # Create browser instance, and launch it while pre-downloading the resume so the file is
+        # already on disk when the agent asks for it
+        browser = Browser()
+        browser_result, resume_result = await asyncio.gather(browser.start(), fetch_resume(), return_exceptions=True)
+        if isinstance(browser_result, BaseException):
+            raise browser_result
+        if isinstance(resume_result, BaseException):
+            # Not fatal: the download_resume tool retries when the agent needs the file
+            print(f"⚠️  Resume pre-download failed: {resume_result}")
+    
+        # Create agent (system prompt is now self-contained in system_prompt.md)
+        agent = Agent(
+            task=task,
+            llm=llm,
+            browser=browser,
+            tools=tools,
+            max_steps=50,  # Allow more steps for complex forms
+            email=user_email,
+            password=user_password,
+            user_profile=info,  # Pass extracted user profile data
+            # Per-step latency scales with generated tokens; flash mode skips the thinking/evaluation fields
+            flash_mode=os.getenv('AGENT_FLASH_MODE', '').lower() in ('1', 'true', 'yes'),
+        )
+    
+        # Run agent
+        print("🚀 Running agent...")
+        history = await agent.run()
     
     print("\n✅ Agent completed!")
     print(f"\n📊 Final Result:")
@@ -489,8 +634,11 @@ async def main(user_data: dict):
                 actions = step.model_output.action
                 if actions:
                     for action in actions:
-                        action_dict = action.model_dump(exclude_unset=True)
-                        for action_name, params in action_dict.items():
+                        # Only the set action fields, dumping just their params rather than the whole action model
+                        for action_name in action.model_fields_set:
+                            params = getattr(action, action_name)
+                            if hasattr(params, 'model_dump'):
+                                params = params.model_dump(exclude_unset=True)
                             if params:
                                 print(f"  - {action_name}: {params}")
 
@@ -498,8 +646,8 @@ async def main(user_data: dict):
 def load_user_data(json_path: str | None = None) -> dict | None:
     """Load user data from JSON file or use inline data"""
     if json_path and os.path.exists(json_path):
-        with open(json_path, 'r') as f:
-            return json.load(f)
+        with open(json_path, 'rb') as f:
+            return json_loads(f.read())
     return USER_DATA
 
 
@@ -516,7 +664,7 @@ if __name__ == '__main__':
     if args.user_data:
         user_data = load_user_data(args.user_data)
     elif args.user_json:
-        user_data = json.loads(args.user_json)
+        user_data = json_loads(args.user_json)
     elif USER_DATA is not None:
         user_data = USER_DATA
     
@@ -530,5 +678,9 @@ if __name__ == '__main__':
         print("Ready for your user JSON! Provide it via --user-data or --user-json flag.")
         sys.exit(1)
     
-    asyncio.run(main(user_data))
+    # Extract the user info and build the task synchronously, before the event loop starts
+    info = extract_user_info(user_data)
+    task = build_task_from_user_info(info)
+    
+    asyncio.run(main(info, task))
 
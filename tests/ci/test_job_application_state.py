@@ -0,0 +1,159 @@
+"""Tests for the job application PipelineState bookkeeping."""
+
+from typing import Optional
+
+from browser_use.job_application.pipeline.question_extraction.schema import ApplicationQuestion
+from browser_use.job_application.pipeline.shared.enums import QuestionType, SectionType
+from browser_use.job_application.pipeline.shared.schemas import ApplicationResult, ApplicationSection, QuestionAnswer
+from browser_use.job_application.pipeline.state import PipelineState
+
+
+def _section(
+	name: Optional[str], section_index: int, section_type: SectionType = SectionType.PERSONAL_INFO
+) -> ApplicationSection:
+	return ApplicationSection(section_type=section_type, name=name, section_index=section_index)
+
+
+def _question(text: str, element_index: int = 1) -> ApplicationQuestion:
+	return ApplicationQuestion(
+		question_text=text,
+		is_required=True,
+		question_type=QuestionType.TEXT,
+		element_index=element_index,
+		section_type=SectionType.PERSONAL_INFO,
+	)
+
+
+def _answer(text: str, value: str, filled: bool = True, error: Optional[str] = None) -> QuestionAnswer:
+	return QuestionAnswer(
+		question_text=text,
+		answer_value=value,
+		answer_type=QuestionType.TEXT,
+		element_index=1,
+		filled_successfully=filled,
+		error_message=error,
+	)
+
+
+def test_repeated_answers_count_once():
+	"""Answering the same question again replaces the answer without double counting"""
+	state = PipelineState()
+	section = state.add_section(_section('Contact', 0))
+	question = section.add_question(_question('First name'))
+
+	state.set_question_answer(section, question, _answer('First name', 'Ada'))
+	state.set_question_answer(section, question, _answer('First name', 'Grace'))
+
+	assert state.answered_count == 1
+	assert [answer.answer_value for answer in state.get_all_question_answers()] == ['Grace']
+	assert section.answers_by_text['First name'].answer_value == 'Grace'
+
+
+def test_apply_fill_result_tracks_failures_and_recovery():
+	"""Failed fills count retries and drop the question from the filled set until it succeeds"""
+	state = PipelineState()
+	section = state.add_section(_section('Contact', 0))
+	question = section.add_question(_question('Email'))
+
+	assert state.apply_fill_result(section, question, _answer('Email', 'a@b.c')) == 0
+	assert 'Email' in section.filled_question_texts
+
+	assert state.apply_fill_result(section, question, _answer('Email', 'a@b.c', filled=False, error='not found')) == 1
+	assert state.apply_fill_result(section, question, _answer('Email', 'a@b.c', filled=False, error='not found')) == 2
+	assert 'Email' not in section.filled_question_texts
+	assert state.failed_questions == {'Email': 2}
+
+	assert state.apply_fill_result(section, question, _answer('Email', 'a@b.c')) == 0
+	assert 'Email' in section.filled_question_texts
+	assert state.answered_count == 1
+
+
+def test_recompleting_section_counts_once():
+	"""Completing a section twice, directly or by name, keeps the completed count at one"""
+	state = PipelineState()
+	section = state.add_section(_section('Contact', 0))
+
+	state.complete_section(section)
+	state.complete_section(section)
+	state.mark_section_complete('Contact')
+
+	assert state.completed_sections_count == 1
+	assert state.get_completed_sections() == ['Contact']
+
+
+def test_duplicate_section_names():
+	"""Sections sharing a name stay distinct by key; name-based methods target the first one"""
+	state = PipelineState()
+	first_section = _section('Work Experience', 0, SectionType.WORK_EXPERIENCE)
+	second_section = _section('Work Experience', 1, SectionType.WORK_EXPERIENCE)
+	first = state.add_section(first_section)
+	second = state.add_section(second_section)
+
+	assert state.find_section(first_section) is first
+	assert state.find_section(second_section) is second
+
+	state.add_question_to_section('Work Experience', _question('Job title'))
+	state.update_question_answer('Work Experience', 'Job title', _answer('Job title', 'Engineer'))
+	state.mark_section_complete('Work Experience')
+
+	assert first.find_question('Job title') is not None
+	assert second.find_question('Job title') is None
+	assert first.is_complete and not second.is_complete
+	assert state.get_completed_sections() == ['Work Experience']
+
+
+def test_unnamed_section_uses_type_as_display_name():
+	"""Sections without a name are addressed and reported by their type"""
+	state = PipelineState()
+	state.add_section(_section(None, 0, SectionType.EDUCATION))
+
+	state.mark_section_complete('EDUCATION')
+
+	assert state.get_completed_sections() == ['EDUCATION']
+
+
+def test_to_serializable():
+	"""Serialization flattens sections and questions; only failed fills carry error_message"""
+	state = PipelineState()
+	section = state.add_section(_section('Contact', 0))
+	name = section.add_question(_question('First name'))
+	phone = section.add_question(_question('Phone', element_index=2))
+	section.add_question(_question('Website', element_index=3))
+
+	state.apply_fill_result(section, name, _answer('First name', 'Ada'))
+	state.apply_fill_result(section, phone, _answer('Phone', '555', filled=False, error='invalid format'))
+	state.complete_section(section)
+
+	assert state.to_serializable() == [
+		{
+			'name': 'Contact',
+			'type': 'PERSONAL_INFO',
+			'is_complete': True,
+			'questions': [
+				{'question_text': 'First name', 'answer_value': 'Ada', 'filled_successfully': True},
+				{
+					'question_text': 'Phone',
+					'answer_value': '555',
+					'filled_successfully': False,
+					'error_message': 'invalid format',
+				},
+				{'question_text': 'Website', 'answer_value': None, 'filled_successfully': False},
+			],
+		}
+	]
+
+
+def test_application_result_carries_error_message_only_on_failures():
+	"""The result payload built from the state keeps error_message for failed fills and omits it otherwise"""
+	state = PipelineState()
+	section = state.add_section(_section('Contact', 0))
+	name = section.add_question(_question('First name'))
+	phone = section.add_question(_question('Phone', element_index=2))
+	state.apply_fill_result(section, name, _answer('First name', 'Ada'))
+	state.apply_fill_result(section, phone, _answer('Phone', '555', filled=False, error='invalid format'))
+
+	result = ApplicationResult(success=True, sections=state.to_serializable())
+	questions = result.model_dump()['sections'][0]['questions']
+
+	assert 'error_message' not in questions[0]
+	assert questions[1]['error_message'] == 'invalid format'